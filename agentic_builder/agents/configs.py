@@ -1,3 +1,6 @@
+import os
+from functools import lru_cache
+from pathlib import Path
 from typing import List
 
 from pydantic import BaseModel
@@ -309,6 +312,13 @@ AGENT_CONFIGS_MAP = {
 
 AGENT_CONFIGS = list(AGENT_CONFIGS_MAP.values())
 
+# Every AgentType (aliases included) resolved to its config once at import time
+_CONFIG_BY_TYPE = {
+    t: config
+    for t in AgentType
+    if (config := AGENT_CONFIGS_MAP.get(resolve_agent_type(t)) or AGENT_CONFIGS_MAP.get(t)) is not None
+}
+
 
 def get_agent_config(agent_type: AgentType) -> AgentConfig:
     """Get configuration for an agent type, resolving aliases if needed.
@@ -316,8 +326,7 @@ def get_agent_config(agent_type: AgentType) -> AgentConfig:
     Raises:
         ValueError: If no configuration exists for the agent type.
     """
-    resolved_type = resolve_agent_type(agent_type)
-    config = AGENT_CONFIGS_MAP.get(resolved_type) or AGENT_CONFIGS_MAP.get(agent_type)
+    config = _CONFIG_BY_TYPE.get(agent_type)
     if config is None:
         raise ValueError(
             f"No configuration found for agent type '{agent_type.value}'. "
@@ -332,20 +341,28 @@ def get_agents_by_layer(layer: str) -> List[AgentConfig]:
 
 
 def get_agent_prompt(agent_type: AgentType) -> str:
-    """Load the prompt for an agent from its XML file."""
-    from pathlib import Path
+    """Load the prompt for an agent from its XML file.
+
+    Prompt paths are relative to the working directory, so results are cached
+    per (agent type, cwd) and the files are read once per run.
+    """
+    return _load_agent_prompt(agent_type, os.getcwd())
+
 
+@lru_cache(maxsize=None)
+def _load_agent_prompt(agent_type: AgentType, cwd: str) -> str:
+    prompts_dir = Path(cwd) / "prompts"
     prompt = ""
     # Prepend common schema instructions
-    schema_path = Path("prompts/common_schema.xml")
+    schema_path = prompts_dir / "common_schema.xml"
     if schema_path.exists():
         prompt += schema_path.read_text() + "\n\n"
 
     # Try resolved type first, then original type
     resolved_type = resolve_agent_type(agent_type)
-    path = Path(f"prompts/agents/{resolved_type.value}.xml")
+    path = prompts_dir / "agents" / f"{resolved_type.value}.xml"
     if not path.exists():
-        path = Path(f"prompts/agents/{agent_type.value}.xml")
+        path = prompts_dir / "agents" / f"{agent_type.value}.xml"
 
     if path.exists():
         prompt += path.read_text()
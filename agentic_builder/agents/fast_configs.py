@@ -18,6 +18,7 @@ Usage:
     from agentic_builder.agents.fast_configs import FAST_AGENT_CONFIGS_MAP
 """
 
+from collections import Counter
 from typing import List
 
 from pydantic import BaseModel
@@ -312,11 +313,24 @@ FAST_AGENT_CONFIGS_MAP = {
 
 FAST_AGENT_CONFIGS = list(FAST_AGENT_CONFIGS_MAP.values())
 
+# Every AgentType (aliases included) resolved to its config once at import time
+_CONFIG_BY_TYPE = {
+    t: config
+    for t in AgentType
+    if (config := FAST_AGENT_CONFIGS_MAP.get(resolve_agent_type(t)) or FAST_AGENT_CONFIGS_MAP.get(t)) is not None
+}
+
+# Static per-agent strings written into workflow manifests
+AGENT_VALUE = {a: a.value for a in AgentType}
+SUBAGENT_NAME = {a: f"main-{a.value.lower().replace('_', '-')}" for a in AgentType}
+
+# Agents per model tier value; fixed by the table above, so counted once
+TIER_DISTRIBUTION = dict(Counter(c.model_tier.value for c in FAST_AGENT_CONFIGS))
+
 
 def get_fast_agent_config(agent_type: AgentType) -> AgentConfig:
     """Get fast configuration for an agent type."""
-    resolved_type = resolve_agent_type(agent_type)
-    config = FAST_AGENT_CONFIGS_MAP.get(resolved_type) or FAST_AGENT_CONFIGS_MAP.get(agent_type)
+    config = _CONFIG_BY_TYPE.get(agent_type)
     if config is None:
         raise ValueError(f"No fast config for agent type '{agent_type.value}'")
     return config
@@ -324,10 +338,7 @@ def get_fast_agent_config(agent_type: AgentType) -> AgentConfig:
 
 def get_tier_distribution() -> dict:
     """Get count of agents per model tier."""
-    from collections import Counter
-
-    tiers = Counter(c.model_tier.value for c in FAST_AGENT_CONFIGS)
-    return dict(tiers)
+    return TIER_DISTRIBUTION.copy()
 
 
 def print_tier_summary():
@@ -1,3 +1,4 @@
+import logging
 import re
 from pathlib import Path
 
@@ -7,6 +8,17 @@ from agentic_builder.common.types import AgentOutput, Artifact
 # Module logger
 logger = get_logger(__name__)
 
+# Patterns compiled once at import; parse() runs once per agent turn
+_SUMMARY_RE = re.compile(r"<summary>(.*?)</summary>", re.DOTALL)
+_NEXT_STEPS_RE = re.compile(r"<next_steps>(.*?)</next_steps>", re.DOTALL)
+_WARNINGS_RE = re.compile(r"<warnings>(.*?)</warnings>", re.DOTALL)
+# New format: <artifact path="..." action="created|modified"/>
+_ARTIFACT_PATH_RE = re.compile(r'<artifact\s+path=["\'](.*?)["\']\s*(?:action=["\'](\w+)["\'])?\s*/?>', re.DOTALL)
+# Legacy format: <artifact name="..." type="...">content</artifact>
+_ARTIFACT_LEGACY_RE = re.compile(
+    r'<artifact\s+name=["\'](.*?)["\']\s+type=["\'](.*?)["\']\s*>(.*?)</artifact>', re.DOTALL
+)
+
 
 class ResponseParser:
     @staticmethod
@@ -14,12 +26,17 @@ class ResponseParser:
         log_separator(logger, "RESPONSE PARSING", char="-")
         logger.debug(f"Input text length: {len(text)} characters")
 
+        # Plain text without any tags: every pattern would miss, so skip the regex passes
+        if "<" not in text:
+            logger.debug("No tags in response, using full text as summary (fallback)")
+            return AgentOutput(success=True, summary=text.strip(), artifacts=[], next_steps=[], warnings=[])
+
         # Simple XML parsing using regex for MVP
         # Robust implementation would use lxml or ElementTree, but LLM output might be malformed.
 
         # Extract summary
         logger.debug("Extracting <summary> tag...")
-        summary_match = re.search(r"<summary>(.*?)</summary>", text, re.DOTALL)
+        summary_match = _SUMMARY_RE.search(text)
         summary = summary_match.group(1).strip() if summary_match else text.strip()[:100] + "..."
         if summary == text.strip()[:100] + "...":
             # If no summary tag, treat whole text as summary (fallback)
@@ -29,45 +46,46 @@ class ResponseParser:
             logger.debug(f"Found summary: {truncate_for_log(summary, max_length=200)}")
 
         # Extract artifacts - new format: <artifact path="..." action="created|modified"/>
-        artifacts = []
+        # Built in one comprehension per format; per-artifact logging only runs under debug
+        debug = logger.isEnabledFor(logging.DEBUG)
 
         # New path-based format (self-closing or with empty content)
         logger.debug("Extracting artifacts (path-based format)...")
-        path_pattern = re.compile(r'<artifact\s+path=["\'](.*?)["\']\s*(?:action=["\'](\w+)["\'])?\s*/?>', re.DOTALL)
-        for match in path_pattern.finditer(text):
-            file_path = match.group(1)
-            action = match.group(2) if match.group(2) else "created"
-            # Extract filename from path
-            name = Path(file_path).name
-            logger.debug(f"  Found artifact: path={file_path}, action={action}")
-            artifacts.append(
-                Artifact(
-                    name=name,
-                    type="file",
-                    path=file_path,
-                    content=None,  # Content is on disk, not in XML
-                    action=action,
-                )
+        artifacts = [
+            Artifact(
+                name=Path(match.group(1)).name,  # Filename from path
+                type="file",
+                path=match.group(1),
+                content=None,  # Content is on disk, not in XML
+                action=match.group(2) or "created",
             )
+            for match in _ARTIFACT_PATH_RE.finditer(text)
+        ]
+        if debug:
+            for artifact in artifacts:
+                logger.debug(f"  Found artifact: path={artifact.path}, action={artifact.action}")
 
         # Legacy format fallback: <artifact name="..." type="...">content</artifact>
         # Only use if no path-based artifacts found
         if not artifacts:
             logger.debug("No path-based artifacts found, trying legacy format...")
-            legacy_pattern = re.compile(
-                r'<artifact\s+name=["\'](.*?)["\']\s+type=["\'](.*?)["\']\s*>(.*?)</artifact>', re.DOTALL
-            )
-            for match in legacy_pattern.finditer(text):
-                name, type_, content = match.groups()
-                logger.debug(f"  Found legacy artifact: name={name}, type={type_}, content_length={len(content)}")
-                artifacts.append(Artifact(name=name, type=type_, content=content.strip()))
+            artifacts = [
+                Artifact(name=name, type=type_, content=content.strip())
+                for name, type_, content in (match.groups() for match in _ARTIFACT_LEGACY_RE.finditer(text))
+            ]
+            if debug:
+                for artifact in artifacts:
+                    logger.debug(
+                        f"  Found legacy artifact: name={artifact.name}, type={artifact.type}, "
+                        f"content_length={len(artifact.content)}"
+                    )
 
         logger.debug(f"Total artifacts found: {len(artifacts)}")
 
         # Extract next steps
         logger.debug("Extracting <next_steps> tag...")
         next_steps = []
-        steps_match = re.search(r"<next_steps>(.*?)</next_steps>", text, re.DOTALL)
+        steps_match = _NEXT_STEPS_RE.search(text)
         if steps_match:
             lines = steps_match.group(1).strip().split("\n")
             next_steps = [line.strip().lstrip("- ").strip() for line in lines if line.strip()]
@@ -78,7 +96,7 @@ class ResponseParser:
         # Extract warnings
         logger.debug("Extracting <warnings> tag...")
         warnings = []
-        warn_match = re.search(r"<warnings>(.*?)</warnings>", text, re.DOTALL)
+        warn_match = _WARNINGS_RE.search(text)
         if warn_match:
             lines = warn_match.group(1).strip().split("\n")
             warnings = [line.strip().lstrip("- ").strip() for line in lines if line.strip()]
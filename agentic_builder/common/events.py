@@ -1,21 +1,91 @@
-from typing import Any, Callable, Dict, List
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+Listener = Callable[[Any], None]
 
 
 class EventEmitter:
     def __init__(self):
-        self._listeners: Dict[str, List[Callable[[Any], None]]] = {}
+        # None until the first listener is added. Each event maps to a bare
+        # listener while it has exactly one, and to a tuple once it has more.
+        # Tuples are replaced rather than mutated, so emit() can iterate them
+        # without copying even if a listener calls on()/off() mid-dispatch.
+        self._listeners: Optional[Dict[str, Union[Listener, Tuple[Listener, ...]]]] = None
+        # Listeners removed from a tuple but not yet compacted away, counted per
+        # event. The next on()/emit() for that event rebuilds the tuple once for
+        # all of them; until then the removed callables stay referenced here.
+        self._removed: Optional[Dict[str, Counter]] = None
 
-    def on(self, event: str, listener: Callable[[Any], None]):
-        if event not in self._listeners:
-            self._listeners[event] = []
-        self._listeners[event].append(listener)
+    def on(self, event: str, listener: Listener):
+        if self._listeners is None:
+            self._listeners = {}
+        elif self._removed is not None and event in self._removed:
+            self._compact(event)
+        current = self._listeners.get(event)
+        if current is None:
+            self._listeners[event] = listener
+        elif type(current) is tuple:
+            self._listeners[event] = current + (listener,)
+        else:
+            self._listeners[event] = (current, listener)
 
-    def off(self, event: str, listener: Callable[[Any], None]):
-        if event in self._listeners:
-            if listener in self._listeners[event]:
-                self._listeners[event].remove(listener)
+    def off(self, event: str, listener: Listener):
+        if not self._listeners:
+            return
+        current = self._listeners.get(event)
+        if current is None:
+            return
+        if type(current) is tuple:
+            # Defer the O(n) rebuild so a burst of removals pays for it once
+            if self._removed is None:
+                self._removed = {}
+            self._removed.setdefault(event, Counter())[listener] += 1
+            return
+        if current != listener:
+            return
+        del self._listeners[event]
+        if not self._listeners:
+            self._listeners = None
 
     def emit(self, event: str, payload: Any = None):
-        if event in self._listeners:
-            for listener in self._listeners[event]:
-                listener(payload)
+        listeners = self._listeners
+        if listeners is None:
+            return
+        if self._removed is not None and event in self._removed:
+            self._compact(event)
+            listeners = self._listeners
+            if listeners is None:
+                return
+        current = listeners.get(event)
+        if current is None:
+            return
+        if type(current) is not tuple:
+            current(payload)
+            return
+        for listener in current:
+            listener(payload)
+
+    def emit_batch(self, event: str, payloads: List[Any]):
+        """Emit ``event`` once with the whole list of payloads (no-op if empty)."""
+        if payloads:
+            self.emit(event, payloads)
+
+    def _compact(self, event: str):
+        """Drop the pending removals for ``event`` in a single pass over its listeners."""
+        removed = self._removed.pop(event)
+        if not self._removed:
+            self._removed = None
+        kept = []
+        for listener in self._listeners[event]:
+            if removed[listener]:
+                removed[listener] -= 1  # Each off() removes one registration
+            else:
+                kept.append(listener)
+        if len(kept) > 1:
+            self._listeners[event] = tuple(kept)
+        elif kept:
+            self._listeners[event] = kept[0]
+        else:
+            del self._listeners[event]
+            if not self._listeners:
+                self._listeners = None
@@ -1,6 +1,6 @@
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
@@ -64,6 +64,9 @@ class AgentType(str, Enum):
     DEV_BACKEND = "DEV_BACKEND"  # Alias for DEV_CORE_API
 
 
+# Every agent type (aliases included) in definition order, built once
+ALL_AGENT_TYPES: Tuple[AgentType, ...] = tuple(AgentType)
+
 # Mapping of legacy agent types to new types
 AGENT_TYPE_ALIASES = {
     AgentType.UIUX: AgentType.UIUX_GUI,
@@ -1,4 +1,16 @@
+import json
+import os
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any, Optional, Union
+
+try:
+    import orjson  # Optional speedup: pip install "agentic-builder[fast]"
+except ImportError:
+    orjson = None
+
+# ISO-8601 UTC with a literal "Z" suffix, e.g. 2025-01-01T12:00:00.000000Z
+_ISO_Z_FMT = "%Y-%m-%dT%H:%M:%S.%fZ"
 
 
 def get_project_root() -> Path:
@@ -13,3 +25,36 @@ def get_project_root() -> Path:
             return current
         current = current.parent
     return Path.cwd()
+
+
+def resolve_within(root: str, path: str) -> Optional[str]:
+    """
+    Resolve ``path`` against ``root`` and return it only if it stays inside ``root``.
+
+    ``root`` must itself be fully resolved. Symlinks are followed, so a link that
+    points outside the project is rejected as well. Works on plain strings with
+    os.path to avoid building Path objects for every artifact.
+    """
+    target = os.path.realpath(os.path.join(root, path))
+    if os.path.commonpath((root, target)) != root:
+        return None
+    return target
+
+
+def utc_timestamp() -> str:
+    """Return the current UTC time as an ISO-8601 string with a ``Z`` suffix."""
+    return datetime.now(timezone.utc).strftime(_ISO_Z_FMT)
+
+
+def dumps_json(data: Any) -> bytes:
+    """Encode data as indented JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def loads_json(raw: Union[bytes, str]) -> Any:
+    """Decode JSON bytes or text (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
@@ -1,18 +1,26 @@
-"""Integration - External service integrations."""
-
-from agentic_builder.integration.batched_git import BatchedGitManager, PhaseCommitStrategy
-from agentic_builder.integration.claude_client import ClaudeClient
-from agentic_builder.integration.git_manager import GitManager
-from agentic_builder.integration.long_running_session import (
-    LongRunningCLISession,
-    MessageDirection,
-    StreamEvent,
-    StreamEventType,
-    StreamLogger,
-    StreamMessage,
-    create_session_with_logging,
-)
-from agentic_builder.integration.pr_manager import PRManager
+"""Integration - External service integrations.
+
+Submodules are imported lazily (PEP 562) so that importing one client does
+not load the others.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # Static analysers see the real names; runtime goes through __getattr__
+    from agentic_builder.integration.batched_git import BatchedGitManager, PhaseCommitStrategy
+    from agentic_builder.integration.claude_client import ClaudeClient
+    from agentic_builder.integration.git_manager import GitManager
+    from agentic_builder.integration.long_running_session import (
+        LongRunningCLISession,
+        MessageDirection,
+        StreamEvent,
+        StreamEventType,
+        StreamLogger,
+        StreamMessage,
+        create_session_with_logging,
+    )
+    from agentic_builder.integration.pr_manager import PRManager
 
 __all__ = [
     "ClaudeClient",
@@ -29,3 +37,34 @@ __all__ = [
     "MessageDirection",
     "create_session_with_logging",
 ]
+
+_LONG_RUNNING = "agentic_builder.integration.long_running_session"
+
+# Public name -> submodule that defines it
+_LAZY = {
+    "ClaudeClient": "agentic_builder.integration.claude_client",
+    "GitManager": "agentic_builder.integration.git_manager",
+    "PRManager": "agentic_builder.integration.pr_manager",
+    "BatchedGitManager": "agentic_builder.integration.batched_git",
+    "PhaseCommitStrategy": "agentic_builder.integration.batched_git",
+    "LongRunningCLISession": _LONG_RUNNING,
+    "StreamLogger": _LONG_RUNNING,
+    "StreamMessage": _LONG_RUNNING,
+    "StreamEvent": _LONG_RUNNING,
+    "StreamEventType": _LONG_RUNNING,
+    "MessageDirection": _LONG_RUNNING,
+    "create_session_with_logging": _LONG_RUNNING,
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Cache so __getattr__ is only hit once per name
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -21,7 +21,7 @@ from agentic_builder.common.types import AgentType
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class StagedChange:
     """A staged file change waiting to be committed."""
 
@@ -30,7 +30,7 @@ class StagedChange:
     summary: str
 
 
-@dataclass
+@dataclass(slots=True)
 class CommitPhase:
     """A collection of changes for a single commit."""
 
@@ -1,9 +1,11 @@
+import io
 import json
 import os
 import shutil
 import subprocess
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 from agentic_builder.agents.configs import get_agent_prompt
 from agentic_builder.agents.response_parser import ResponseParser
@@ -23,13 +25,19 @@ DEFAULT_PERMISSION_DENIES = [
     "Read(./build)",
 ]
 
+# Mock-mode responses, cached per agent type by ClaudeClient._mock_response
+_MOCK_RESPONSES: Dict[AgentType, AgentOutput] = {}
+
 
 class ClaudeClient:
     def __init__(self, output_dir: Optional[Path] = None):
         self._local_claude_dir = None
+        self._cli_env: Optional[Dict[str, str]] = None
         # Use provided output_dir or fall back to get_project_root()
         self._output_dir = output_dir.resolve() if output_dir else get_project_root()
         logger.debug(f"ClaudeClient initialized with output_dir: {self._output_dir}")
+        # Mock mode is fixed for the lifetime of the client
+        self._mock_cli = os.environ.get("AMAB_MOCK_CLAUDE_CLI") == "1"
 
     @property
     def output_dir(self) -> Path:
@@ -90,7 +98,7 @@ class ClaudeClient:
         logger.debug(f"Agent Type: {agent_type.value}")
         logger.debug(f"Model Tier: {model.value}")
 
-        if os.environ.get("AMAB_MOCK_CLAUDE_CLI") == "1":
+        if self._mock_cli:
             logger.debug("MOCK MODE: Returning mock response (AMAB_MOCK_CLAUDE_CLI=1)")
             mock_response = self._mock_response(agent_type)
             logger.debug(f"Mock Response Summary: {mock_response.summary}")
@@ -153,35 +161,28 @@ class ClaudeClient:
         project_root = self._output_dir
         logger.debug(f"Working Directory: {project_root}")
 
-        # Set up local .claude config directory with credentials and security settings
-        local_claude_dir = self._setup_local_claude_config(project_root)
-        logger.debug(f"Claude Config Directory: {local_claude_dir}")
-
-        # Create environment with CLAUDE_CONFIG_DIR pointing to local .claude
-        env = os.environ.copy()
-        env["CLAUDE_CONFIG_DIR"] = str(local_claude_dir)
+        # Set up local .claude config directory (credentials, security settings) and the
+        # CLI environment once per client; both depend only on the fixed project root
+        if self._cli_env is None:
+            self._local_claude_dir = self._setup_local_claude_config(project_root)
+            # Inherit the full environment (auth, proxy, PATH) with CLAUDE_CONFIG_DIR pointing to local .claude
+            self._cli_env = {**os.environ, "CLAUDE_CONFIG_DIR": str(self._local_claude_dir)}
+        logger.debug(f"Claude Config Directory: {self._local_claude_dir}")
 
         try:
             logger.debug("Executing Claude CLI...")
-            result = subprocess.run(
-                cmd,
-                input=user_input,
-                capture_output=True,
-                text=True,
-                check=True,
-                cwd=project_root,  # Ensure agent writes files relative to project root
-                env=env,  # Use local .claude config
-            )
+            # Agent writes files relative to project root, using the local .claude config
+            stdout, stderr = self._run_cli(cmd, user_input, cwd=project_root, env=self._cli_env)
 
             log_separator(logger, "RAW RESPONSE (stdout)", char="-")
-            logger.debug(f"Response Length: {len(result.stdout)} characters")
-            logger.debug(f"Raw Response:\n{truncate_for_log(result.stdout, max_length=10000)}")
+            logger.debug(f"Response Length: {len(stdout)} characters")
+            logger.debug(f"Raw Response:\n{truncate_for_log(stdout, max_length=10000)}")
 
-            if result.stderr:
+            if stderr:
                 log_separator(logger, "STDERR", char="-")
-                logger.debug(f"Stderr:\n{truncate_for_log(result.stderr, max_length=2000)}")
+                logger.debug(f"Stderr:\n{truncate_for_log(stderr, max_length=2000)}")
 
-            parsed_output = ResponseParser.parse(result.stdout)
+            parsed_output = ResponseParser.parse(stdout)
 
             log_separator(logger, "PARSED OUTPUT", char="-")
             logger.debug(f"Success: {parsed_output.success}")
@@ -209,13 +210,64 @@ class ClaudeClient:
             logger.error("Claude CLI executable not found. Ensure 'claude' is installed and in PATH.")
             return AgentOutput(success=False, summary="Claude CLI not found.")
 
-    def _mock_response(self, agent_type: AgentType) -> AgentOutput:
-        # Generate a plausible mock response based on agent type
-        summary = f"Mock response for {agent_type.value}"
-        return AgentOutput(
-            success=True,
-            summary=summary,
-            artifacts=[],
-            next_steps=["Review output", "Proceed to next stage"],
-            metadata={"tokensUsed": 150},
-        )
+    @staticmethod
+    def _run_cli(cmd: List[str], user_input: str, cwd: Path, env: dict) -> Tuple[str, str]:
+        """
+        Run the Claude CLI, feeding ``user_input`` on stdin and reading stdout as it arrives.
+
+        stdin is written and stderr drained on helper threads, so a large context
+        or a chatty stderr cannot fill a pipe and stall the CLI while stdout is
+        read line by line.
+
+        Raises:
+            subprocess.CalledProcessError: If the CLI exits non-zero (output attached).
+        """
+        stdout_buf = io.StringIO()
+        stderr_parts: List[str] = []
+        with subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            cwd=cwd,
+            env=env,
+        ) as process:
+
+            def feed_stdin():
+                try:
+                    process.stdin.write(user_input)
+                    process.stdin.close()
+                except BrokenPipeError:  # CLI exited without reading all of its input
+                    pass
+
+            writer = threading.Thread(target=feed_stdin, daemon=True)
+            drainer = threading.Thread(target=lambda: stderr_parts.append(process.stderr.read()), daemon=True)
+            writer.start()
+            drainer.start()
+            for line in process.stdout:
+                stdout_buf.write(line)
+            writer.join()
+            drainer.join()
+            returncode = process.wait()
+
+        stdout = stdout_buf.getvalue()
+        stderr = "".join(stderr_parts)
+        if returncode:
+            raise subprocess.CalledProcessError(returncode, cmd, output=stdout, stderr=stderr)
+        return stdout, stderr
+
+    @staticmethod
+    def _mock_response(agent_type: AgentType) -> AgentOutput:
+        # One plausible response per agent type, built on first use; callers get a
+        # deep copy so mutating a response cannot leak into later mock calls
+        response = _MOCK_RESPONSES.get(agent_type)
+        if response is None:
+            response = _MOCK_RESPONSES[agent_type] = AgentOutput(
+                success=True,
+                summary=f"Mock response for {agent_type.value}",
+                artifacts=[],
+                next_steps=["Review output", "Proceed to next stage"],
+                metadata={"tokensUsed": 150},
+            )
+        return response.model_copy(deep=True)
@@ -1,3 +1,4 @@
+import shlex
 import subprocess
 from pathlib import Path
 from typing import List, Optional
@@ -24,12 +25,34 @@ class GitManager:
     def commit_files(self, files: List[str], message: str):
         if not files:
             return
-        self._run(["git", "add"] + files)
-        self._run(["git", "commit", "-m", message])
+        self._run_batch([["git", "add"] + files, ["git", "commit", "-m", message]])
+
+    def commit_and_push(self, branch_name: str, message: str, files: List[str]):
+        """Stage, commit and push ``files`` to ``branch_name`` in one subprocess."""
+        if not files:
+            return
+        self._run_batch(
+            [
+                ["git", "add"] + files,
+                ["git", "commit", "-m", message],
+                ["git", "push", "-u", "origin", branch_name],
+            ]
+        )
 
     def get_status(self) -> str:
         return self._run(["git", "status", "--porcelain"], capture_output=True)
 
+    def _run_batch(self, cmds: List[List[str]], capture_output=False, check=True):
+        """
+        Run sequential git commands through a single shell, stopping at the first failure.
+
+        The shell still starts one git process per command, plus itself; what is
+        saved is one Python subprocess round-trip (spawn, pipe setup, wait) per
+        extra command. Each argument is shell-quoted.
+        """
+        script = " && ".join(shlex.join(cmd) for cmd in cmds)
+        return self._run(["sh", "-c", script], capture_output=capture_output, check=check)
+
     def _run(self, cmd: List[str], capture_output=False, check=True):
         try:
             result = subprocess.run(
@@ -74,7 +74,7 @@ class StreamEventType(str, Enum):
     RESULT = "result"
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamEvent:
     """A single streaming event from Claude CLI."""
 
@@ -84,7 +84,7 @@ class StreamEvent:
     raw_line: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamMessage:
     """A logged message with direction and content."""
 
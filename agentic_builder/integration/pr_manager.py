@@ -7,8 +7,12 @@ console = Console()
 
 
 class PRManager:
+    def __init__(self):
+        # Mock mode is fixed for the lifetime of the manager
+        self._mock_gh = os.environ.get("AMAB_MOCK_GH_CLI") == "1"
+
     def create_pr(self, branch: str, title: str, body: str, draft: bool = True):
-        if os.environ.get("AMAB_MOCK_GH_CLI") == "1":
+        if self._mock_gh:
             console.print(f"[bold yellow]MOCK PR CREATION:[/bold yellow] Branch={branch}, Title={title}")
             return "https://github.com/mock/repo/pull/123"
 
@@ -1,5 +1,6 @@
+import sys
 from pathlib import Path
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Optional, Union
 
 import typer
 from rich.console import Console
@@ -12,19 +13,34 @@ from agentic_builder.common.types import (
     WorkflowConstraints,
     WorkflowStatus,
 )
-from agentic_builder.integration.claude_client import ClaudeClient
-from agentic_builder.integration.git_manager import GitManager
-from agentic_builder.integration.pr_manager import PRManager
-from agentic_builder.orchestration.adaptive_orchestrator import AdaptiveOrchestrator
-from agentic_builder.orchestration.parallel_engine import ParallelWorkflowEngine
-from agentic_builder.orchestration.session_manager import SessionManager
-from agentic_builder.orchestration.workflow_engine import WorkflowEngine
-from agentic_builder.pms.task_manager import TaskManager
+
+# Orchestration and integration modules are imported inside the commands that
+# use them, so --help and the lightweight commands start without loading them
+if TYPE_CHECKING:
+    from agentic_builder.orchestration.adaptive_orchestrator import AdaptiveOrchestrator
+    from agentic_builder.orchestration.parallel_engine import ParallelWorkflowEngine
+    from agentic_builder.orchestration.workflow_engine import WorkflowEngine
 
 app = typer.Typer(help="Agentic Software Builder CLI")
 console = Console()
 
 
+def _package_version() -> str:
+    """Installed package version, or "unknown" when running from a source tree."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("agentic-builder")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def _version_callback(value: bool):
+    if value:
+        print(f"agentic-builder {_package_version()}")
+        raise typer.Exit()
+
+
 # Callback for global options
 @app.callback()
 def main_callback(
@@ -34,6 +50,14 @@ def main_callback(
         "-d",
         help="Enable debug logging to see prompts, responses, and internal operations",
     ),
+    version: bool = typer.Option(
+        False,
+        "--version",
+        "-V",
+        callback=_version_callback,
+        is_eager=True,
+        help="Show the version and exit",
+    ),
 ):
     """
     Agentic Mobile App Builder - Build software with AI agents.
@@ -51,7 +75,7 @@ def main_callback(
         console.print("[yellow]Debug logging enabled[/yellow]")
 
 
-def get_engine(output_dir: Optional[Path] = None) -> WorkflowEngine:
+def get_engine(output_dir: Optional[Path] = None) -> "WorkflowEngine":
     """
     Create a WorkflowEngine with all required dependencies.
 
@@ -59,6 +83,13 @@ def get_engine(output_dir: Optional[Path] = None) -> WorkflowEngine:
         output_dir: Optional project root directory for all file operations.
                    Defaults to current working directory if not specified.
     """
+    from agentic_builder.integration.claude_client import ClaudeClient
+    from agentic_builder.integration.git_manager import GitManager
+    from agentic_builder.integration.pr_manager import PRManager
+    from agentic_builder.orchestration.session_manager import SessionManager
+    from agentic_builder.orchestration.workflow_engine import WorkflowEngine
+    from agentic_builder.pms.task_manager import TaskManager
+
     # Default to CWD if no output_dir specified
     resolved_output_dir = output_dir.resolve() if output_dir else Path.cwd()
 
@@ -77,7 +108,7 @@ def get_orchestrator(
     constraints: Optional[WorkflowConstraints] = None,
     use_long_running_session: bool = False,
     stream_log_to_console: bool = False,
-) -> Union[WorkflowEngine, ParallelWorkflowEngine, AdaptiveOrchestrator]:
+) -> Union["WorkflowEngine", "ParallelWorkflowEngine", "AdaptiveOrchestrator"]:
     """
     Factory function to create the appropriate orchestrator.
 
@@ -94,6 +125,8 @@ def get_orchestrator(
     resolved_output_dir = output_dir.resolve() if output_dir else Path.cwd()
 
     if orchestrator_type == OrchestratorType.ADAPTIVE:
+        from agentic_builder.orchestration.adaptive_orchestrator import AdaptiveOrchestrator
+
         return AdaptiveOrchestrator(
             project_root=resolved_output_dir,
             constraints=constraints,
@@ -101,7 +134,14 @@ def get_orchestrator(
             stream_log_to_console=stream_log_to_console,
         )
 
-    elif orchestrator_type == OrchestratorType.PARALLEL:
+    from agentic_builder.integration.claude_client import ClaudeClient
+    from agentic_builder.integration.git_manager import GitManager
+    from agentic_builder.integration.pr_manager import PRManager
+    from agentic_builder.orchestration.session_manager import SessionManager
+
+    if orchestrator_type == OrchestratorType.PARALLEL:
+        from agentic_builder.orchestration.parallel_engine import ParallelWorkflowEngine
+
         return ParallelWorkflowEngine(
             session_manager=SessionManager(output_dir=resolved_output_dir),
             git_manager=GitManager(output_dir=resolved_output_dir),
@@ -110,6 +150,9 @@ def get_orchestrator(
         )
 
     else:  # SEQUENTIAL
+        from agentic_builder.orchestration.workflow_engine import WorkflowEngine
+        from agentic_builder.pms.task_manager import TaskManager
+
         return WorkflowEngine(
             session_manager=SessionManager(output_dir=resolved_output_dir),
             pms_manager=TaskManager(output_dir=resolved_output_dir),
@@ -295,8 +338,21 @@ def run(
         def on_claude_md_created(data):
             console.print(f"  [blue]Created CLAUDE.md:[/blue] {data['path']}")
 
-        engine.on("agent_spawned", on_stage_start)
-        engine.on("agent_completed", on_agent_complete)
+        def on_phase_start(batch):
+            for data in batch:
+                on_stage_start(data)
+
+        def on_phase_complete(batch):
+            for data in batch:
+                on_agent_complete(data)
+
+        if orch_type == OrchestratorType.PARALLEL:
+            # Parallel engine reports progress once per phase with a list of payloads
+            engine.on("phase_started", on_phase_start)
+            engine.on("phase_completed", on_phase_complete)
+        else:
+            engine.on("agent_spawned", on_stage_start)
+            engine.on("agent_completed", on_agent_complete)
         engine.on("workflow_failed", on_fail)
         engine.on("claude_md_created", on_claude_md_created)
 
@@ -315,6 +371,8 @@ def list_sessions(
     status: str = typer.Option(None, "--status", help="Filter by status"),
 ):
     """List sessions."""
+    from agentic_builder.orchestration.session_manager import SessionManager
+
     console.print("[bold]Sessions[/bold]")
     table = Table(title="Active Sessions")
     table.add_column("ID", justify="right", style="cyan", no_wrap=True)
@@ -358,6 +416,8 @@ def resume(id: str):
 @app.command()
 def usage():
     """Show token usage statistics."""
+    from agentic_builder.orchestration.session_manager import SessionManager
+
     manager = SessionManager()
     sessions = manager.list_sessions()
 
@@ -377,6 +437,8 @@ def usage():
 @app.command()
 def logs(id: str):
     """View execution logs."""
+    from agentic_builder.orchestration.session_manager import SessionManager
+
     manager = SessionManager()
     log_file = manager.session_dir / f"{id}.log"
 
@@ -388,5 +450,17 @@ def logs(id: str):
     console.print(log_file.read_text())
 
 
-if __name__ == "__main__":
+def cli():
+    """Console script entry point.
+
+    A bare ``--version`` is answered straight from argv, without Click parsing
+    the command line or running the app callback.
+    """
+    if sys.argv[1:] in (["--version"], ["-V"]):
+        print(f"agentic-builder {_package_version()}")
+        return
     app()
+
+
+if __name__ == "__main__":
+    cli()
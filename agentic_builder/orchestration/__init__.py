@@ -1,11 +1,20 @@
-"""Orchestration - Workflow and session management."""
+"""Orchestration - Workflow and session management.
 
-from agentic_builder.orchestration.adaptive_orchestrator import AdaptiveOrchestrator
-from agentic_builder.orchestration.parallel_engine import ParallelWorkflowEngine
-from agentic_builder.orchestration.session_manager import SessionManager
-from agentic_builder.orchestration.single_session import SingleSessionOrchestrator
-from agentic_builder.orchestration.workflow_engine import WorkflowEngine
-from agentic_builder.orchestration.workflows import WorkflowMapper
+Submodules are imported lazily (PEP 562) so that importing one component,
+e.g. ``agentic_builder.orchestration.session_manager`` from the CLI, does not
+load every engine.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # Static analysers see the real names; runtime goes through __getattr__
+    from agentic_builder.orchestration.adaptive_orchestrator import AdaptiveOrchestrator
+    from agentic_builder.orchestration.parallel_engine import ParallelWorkflowEngine
+    from agentic_builder.orchestration.session_manager import SessionManager
+    from agentic_builder.orchestration.single_session import SingleSessionOrchestrator
+    from agentic_builder.orchestration.workflow_engine import WorkflowEngine
+    from agentic_builder.orchestration.workflows import WorkflowMapper
 
 __all__ = [
     "SessionManager",
@@ -15,3 +24,26 @@ __all__ = [
     "AdaptiveOrchestrator",
     "WorkflowMapper",
 ]
+
+# Public name -> submodule that defines it
+_LAZY = {
+    "SessionManager": "agentic_builder.orchestration.session_manager",
+    "WorkflowEngine": "agentic_builder.orchestration.workflow_engine",
+    "ParallelWorkflowEngine": "agentic_builder.orchestration.parallel_engine",
+    "SingleSessionOrchestrator": "agentic_builder.orchestration.single_session",
+    "AdaptiveOrchestrator": "agentic_builder.orchestration.adaptive_orchestrator",
+    "WorkflowMapper": "agentic_builder.orchestration.workflows",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Cache so __getattr__ is only hit once per name
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -20,15 +20,16 @@ Performance:
 """
 
 import json
+import os
 import time
 from dataclasses import dataclass, field
-from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Set
 
 from agentic_builder.common.logging_config import get_logger
 from agentic_builder.common.types import ScopeLevel, WorkflowConstraints
+from agentic_builder.common.utils import dumps_json, loads_json, utc_timestamp
 
 logger = get_logger(__name__)
 
@@ -39,7 +40,7 @@ class ConfidenceLevel(str, Enum):
     LOW = "low"  # Ask user
 
 
-@dataclass
+@dataclass(slots=True)
 class SpawnRequest:
     """Request to spawn an agent."""
 
@@ -49,7 +50,7 @@ class SpawnRequest:
     context: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class SkipDecision:
     """Decision to skip an agent."""
 
@@ -57,7 +58,7 @@ class SkipDecision:
     reason: str
 
 
-@dataclass
+@dataclass(slots=True)
 class UserQuestion:
     """Question to ask the user."""
 
@@ -71,7 +72,7 @@ class UserQuestion:
     affects: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentDecision:
     """A decision made by an agent."""
 
@@ -82,7 +83,7 @@ class AgentDecision:
     override_prompt: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentOutput:
     """Parsed output from an agent."""
 
@@ -295,10 +296,24 @@ class AdaptiveOrchestrator:
         """Initialize the session and tasks directory."""
         self.tasks_dir.mkdir(parents=True, exist_ok=True)
 
-        manifest = {
+        manifest = self._build_manifest(session_id, project_idea)
+
+        # Log constraint info
+        scope = self.constraints.effective_scope()
+        if scope != ScopeLevel.MVP:
+            logger.info(f"Workflow scope: {scope.value}")
+        if self.constraints.full_feature:
+            logger.info("Full-feature mode enabled - will include all applicable features")
+
+        self._save_manifest(manifest)
+        self._ensure_gitignore()
+
+    def _build_manifest(self, session_id: str, project_idea: str) -> Dict:
+        """Build the initial session manifest written by _initialize_session()."""
+        return {
             "session_id": session_id,
             "project_idea": project_idea,
-            "created_at": datetime.utcnow().isoformat() + "Z",
+            "created_at": utc_timestamp(),
             "constraints": self.constraints.to_manifest_dict(),
             "execution": {
                 "completed": [],
@@ -310,16 +325,6 @@ class AdaptiveOrchestrator:
             "decision_log": [],
         }
 
-        # Log constraint info
-        scope = self.constraints.effective_scope()
-        if scope != ScopeLevel.MVP:
-            logger.info(f"Workflow scope: {scope.value}")
-        if self.constraints.full_feature:
-            logger.info("Full-feature mode enabled - will include all applicable features")
-
-        self._save_manifest(manifest)
-        self._ensure_gitignore()
-
     def _get_agent_model(self, agent_name: str) -> str:
         """Get the model to use for a specific agent.
 
@@ -661,7 +666,7 @@ When done, output your results in JSON format with these fields:
     def _log_decision(self, agent: str, decision: AgentDecision) -> None:
         """Log a decision for transparency."""
         entry = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": utc_timestamp(),
             "agent": agent,
             "decision": decision.decision,
             "confidence": decision.confidence.value,
@@ -714,13 +719,13 @@ When done, output your results in JSON format with these fields:
         """Load the session manifest."""
         manifest_path = self.tasks_dir / "manifest.json"
         if manifest_path.exists():
-            return json.loads(manifest_path.read_text())
+            return loads_json(manifest_path.read_bytes())
         return {}
 
     def _save_manifest(self, manifest: Dict) -> None:
         """Save the session manifest."""
         manifest_path = self.tasks_dir / "manifest.json"
-        manifest_path.write_text(json.dumps(manifest, indent=2))
+        manifest_path.write_bytes(dumps_json(manifest))
 
     def _ensure_gitignore(self) -> None:
         """Ensure .tasks directory is gitignored."""
@@ -735,11 +740,9 @@ When done, output your results in JSON format with these fields:
         else:
             gitignore.write_text(f"{entry}\n")
 
-    def _generate_session_id(self) -> str:
-        """Generate a unique session ID."""
-        import uuid
-
-        return f"adaptive_{uuid.uuid4().hex[:8]}"
+    def _generate_session_id(self, rng: Callable[[int], bytes] = os.urandom) -> str:
+        """Generate a unique session ID from 4 random bytes (8 hex digits)."""
+        return f"adaptive_{rng(4).hex()}"
 
 
 def run_adaptive_workflow(
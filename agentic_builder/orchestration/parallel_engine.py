@@ -12,15 +12,17 @@ Performance Comparison:
 """
 
 import asyncio
+import os
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
-from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Sequence, Set
 
 from agentic_builder.agents.configs import get_agent_config
 from agentic_builder.common.events import EventEmitter
-from agentic_builder.common.logging_config import get_logger, log_separator
+from agentic_builder.common.logging_config import get_logger, is_debug_enabled, log_separator
 from agentic_builder.common.types import AgentType, WorkflowStatus
+from agentic_builder.common.utils import resolve_within
 from agentic_builder.orchestration.session_manager import SessionManager
 from agentic_builder.orchestration.workflows import WorkflowMapper
 from agentic_builder.pms.minimal_context import MinimalContextSerializer
@@ -29,7 +31,7 @@ from agentic_builder.pms.task_file_store import TaskFileStore
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionPhase:
     """A phase of agents that can run in parallel."""
 
@@ -39,7 +41,7 @@ class ExecutionPhase:
     completed_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PhaseResult:
     """Result of executing a phase."""
 
@@ -49,7 +51,7 @@ class PhaseResult:
     duration_seconds: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowMetrics:
     """Metrics for workflow execution."""
 
@@ -80,6 +82,11 @@ class ParallelWorkflowEngine(EventEmitter):
 
     Agents are grouped into phases based on dependency resolution.
     All agents in a phase run concurrently, then the next phase starts.
+
+    Progress is reported once per phase via ``phase_started`` and
+    ``phase_completed`` events whose payload is a list of per-agent dicts.
+    The per-agent ``agent_spawned``/``agent_completed`` events are only
+    emitted when debug logging is enabled; ``agent_failed`` is always emitted.
     """
 
     def __init__(
@@ -98,6 +105,7 @@ class ParallelWorkflowEngine(EventEmitter):
         self.max_concurrent = max_concurrent
         self._active_runs: Dict[str, bool] = {}
         self._semaphore: Optional[asyncio.Semaphore] = None
+        self._per_agent_events = False
 
     def start_workflow(self, workflow_name: str, idea: Optional[str] = None) -> str:
         """Start workflow (sync wrapper for async execution)."""
@@ -163,13 +171,14 @@ class ParallelWorkflowEngine(EventEmitter):
 
         # Initialize semaphore for max concurrency
         self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        self._per_agent_events = is_debug_enabled()
 
         # Track metrics
         metrics = WorkflowMetrics(
             phases_count=len(phases),
             agents_count=len(execution_order),
         )
-        start_time = datetime.now()
+        start_time = time.monotonic()
         sequential_time = 0.0
 
         # Skip already completed agents
@@ -198,7 +207,7 @@ class ParallelWorkflowEngine(EventEmitter):
                 sequential_time += agent_time
 
         # Calculate final metrics
-        total_time = (datetime.now() - start_time).total_seconds()
+        total_time = time.monotonic() - start_time
         metrics.total_time_seconds = total_time
         metrics.parallel_efficiency = total_time / sequential_time if sequential_time > 0 else 1.0
 
@@ -214,9 +223,11 @@ class ParallelWorkflowEngine(EventEmitter):
     ) -> PhaseResult:
         """Execute all agents in a phase concurrently."""
         phase.started_at = datetime.now()
+        self.emit_batch("phase_started", [{"agent": agent} for agent in agents])
 
         # Create tasks for all agents
-        tasks = [self._execute_agent(session_id, task_store, agent, metrics) for agent in agents]
+        completions: List[Dict[str, Any]] = []
+        tasks = [self._execute_agent(session_id, task_store, agent, metrics, completions) for agent in agents]
 
         # Run concurrently
         results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -234,6 +245,8 @@ class ParallelWorkflowEngine(EventEmitter):
             elif not result:
                 failed_agents.append(agent)
 
+        self.emit_batch("phase_completed", completions)
+
         return PhaseResult(
             phase=phase,
             success=len(failed_agents) == 0,
@@ -247,12 +260,14 @@ class ParallelWorkflowEngine(EventEmitter):
         task_store: TaskFileStore,
         agent_type: AgentType,
         metrics: WorkflowMetrics,
+        completions: List[Dict[str, Any]],
     ) -> bool:
-        """Execute a single agent asynchronously."""
+        """Execute a single agent asynchronously, appending its result to ``completions``."""
         async with self._semaphore:
-            start_time = datetime.now()
+            start_time = time.monotonic()
             logger.info(f"Starting agent: {agent_type.value}")
-            self.emit("agent_spawned", {"agent": agent_type})
+            if self._per_agent_events:
+                self.emit("agent_spawned", {"agent": agent_type})
 
             try:
                 task_store.start_task(agent_type)
@@ -286,11 +301,13 @@ class ParallelWorkflowEngine(EventEmitter):
                 )
 
                 # Track metrics
-                duration = (datetime.now() - start_time).total_seconds()
+                duration = time.monotonic() - start_time
                 metrics.agent_times[agent_type.value] = duration
                 metrics.token_usage[agent_type.value] = response.metadata.get("tokensUsed", 0)
 
-                self.emit("agent_completed", {"agent": agent_type, "summary": response.summary})
+                completions.append({"agent": agent_type, "summary": response.summary})
+                if self._per_agent_events:
+                    self.emit("agent_completed", {"agent": agent_type, "summary": response.summary})
                 logger.info(f"Completed agent: {agent_type.value} ({duration:.1f}s)")
                 return True
 
@@ -345,28 +362,23 @@ class ParallelWorkflowEngine(EventEmitter):
     def _process_artifacts(self, response, agent_type: AgentType) -> List[str]:
         """Process and validate artifacts from response."""
         artifacts = []
-        root_path = self.session_manager.output_dir.resolve()
+        root_dir = str(self.session_manager.output_dir.resolve())
 
         for artifact in response.artifacts:
             if artifact.type == "file" and artifact.path:
-                artifact_path = Path(artifact.path)
-                if artifact_path.is_absolute():
-                    fpath = artifact_path.resolve()
-                else:
-                    fpath = (root_path / artifact_path).resolve()
-
-                if not fpath.is_relative_to(root_path):
-                    logger.warning(f"Security: path outside repo: {fpath}")
+                fpath = resolve_within(root_dir, artifact.path)
+                if fpath is None:
+                    logger.warning(f"Security: path outside repo: {artifact.path}")
                     continue
 
-                if fpath.exists():
-                    artifacts.append(str(fpath))
+                if os.path.exists(fpath):
+                    artifacts.append(fpath)
                 else:
                     logger.warning(f"File not found: {fpath}")
 
         return artifacts
 
-    def _compute_phases(self, execution_order: List[AgentType]) -> List[ExecutionPhase]:
+    def _compute_phases(self, execution_order: Sequence[AgentType]) -> List[ExecutionPhase]:
         """
         Group agents into phases where all agents in a phase can run in parallel.
 
@@ -408,7 +420,7 @@ class ParallelWorkflowEngine(EventEmitter):
         session_id: str,
         workflow_name: str,
         idea: str,
-        execution_order: List[AgentType],
+        execution_order: Sequence[AgentType],
     ) -> None:
         """Create CLAUDE.md with project context."""
         project_root = self.session_manager.output_dir
@@ -1,4 +1,3 @@
-import json
 import uuid
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -62,24 +61,32 @@ class SessionManager:
             f.write(session.model_dump_json(indent=2))
         logger.debug(f"Session saved to: {path}")
 
-    def load_session(self, session_id: str) -> Optional[SessionData]:
+    def load_session(self, session_id: str, refresh: bool = False) -> Optional[SessionData]:
+        """
+        Load a session, serving it from the in-memory cache when possible.
+
+        Sessions written through this manager are cached by save_session(), so
+        only the first load of a session touches disk. Pass refresh=True to
+        re-read the file, e.g. when another process may have updated it.
+        """
         logger.debug(f"Loading session: {session_id}")
-        if session_id in self._cache:
+        if not refresh and session_id in self._cache:
             logger.debug(f"Session {session_id} found in cache")
             return self._cache[session_id]
 
         path = self._get_path(session_id)
         if not path.exists():
             logger.debug(f"Session file not found: {path}")
+            self._cache.pop(session_id, None)  # Deleted on disk; don't keep serving it
             return None
 
         logger.debug(f"Loading session from file: {path}")
-        with open(path, "r") as f:
-            data = json.load(f)
-            session = SessionData(**data)
-            self._cache[session_id] = session
-            logger.debug(f"Session loaded: status={session.status}, completed_tasks={len(session.completed_tasks)}")
-            return session
+        # pydantic-core parses and validates the raw bytes in one pass
+        with open(path, "rb") as f:
+            session = SessionData.model_validate_json(f.read())
+        self._cache[session_id] = session
+        logger.debug(f"Session loaded: status={session.status}, completed_tasks={len(session.completed_tasks)}")
+        return session
 
     def update_status(self, session_id: str, status: WorkflowStatus):
         logger.debug(f"Updating session {session_id} status to: {status}")
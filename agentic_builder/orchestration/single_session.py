@@ -17,14 +17,15 @@ Performance Benefits:
 """
 
 import json
+import os
 import subprocess
-from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Optional, Sequence
 
-from agentic_builder.agents.fast_configs import FAST_AGENT_CONFIGS_MAP
+from agentic_builder.agents.fast_configs import AGENT_VALUE, FAST_AGENT_CONFIGS_MAP, SUBAGENT_NAME
 from agentic_builder.common.logging_config import get_logger
 from agentic_builder.common.types import AgentType
+from agentic_builder.common.utils import utc_timestamp
 from agentic_builder.orchestration.workflows import WorkflowMapper
 
 logger = get_logger(__name__)
@@ -44,6 +45,8 @@ class SingleSessionOrchestrator:
 
     TASKS_DIR = ".tasks"
     ORCHESTRATOR_SKILL = "workflow-orchestrator"
+    # The prompt is piped via stdin ("-") so its size is not bounded by ARG_MAX
+    ORCHESTRATOR_CMD = ("claude", "--skill", ORCHESTRATOR_SKILL, "--dangerously-skip-permissions", "-")
 
     def __init__(self, project_root: Path):
         self.project_root = Path(project_root)
@@ -100,11 +103,11 @@ class SingleSessionOrchestrator:
         for agent_type in execution_order:
             config = FAST_AGENT_CONFIGS_MAP.get(agent_type)
             if config:
-                agents[agent_type.value] = {
-                    "dependencies": [d.value for d in config.dependencies],
+                agents[AGENT_VALUE[agent_type]] = {
+                    "dependencies": [AGENT_VALUE[d] for d in config.dependencies],
                     "model": config.model_tier.value,
                     "status": "pending",
-                    "subagent": f"main-{agent_type.value.lower().replace('_', '-')}",
+                    "subagent": SUBAGENT_NAME[agent_type],
                 }
 
         # Compute execution phases
@@ -114,12 +117,12 @@ class SingleSessionOrchestrator:
             "session_id": session_id,
             "workflow": workflow_name,
             "project_idea": project_idea,
-            "created_at": datetime.utcnow().isoformat() + "Z",
+            "created_at": utc_timestamp(),
             "agents": agents,
             "phases": phases,
             "completed": [],
             "in_progress": [],
-            "pending": [a.value for a in execution_order],
+            "pending": [AGENT_VALUE[a] for a in execution_order],
             "current_phase": 0,
         }
 
@@ -133,7 +136,7 @@ class SingleSessionOrchestrator:
 
         return manifest
 
-    def _compute_phases(self, execution_order: List[AgentType]) -> List[dict]:
+    def _compute_phases(self, execution_order: Sequence[AgentType]) -> List[dict]:
         """Group agents into parallel execution phases."""
         phases = []
         completed = set()
@@ -190,17 +193,10 @@ Return a summary when done."""
         try:
             # Invoke Claude with the orchestrator skill
             result = subprocess.run(
-                [
-                    "claude",
-                    "--skill",
-                    self.ORCHESTRATOR_SKILL,
-                    "--dangerously-skip-permissions",
-                    "-p",
-                    prompt,
-                ],
+                self.ORCHESTRATOR_CMD,
+                input=prompt.encode("utf-8"),
                 cwd=self.project_root,
-                capture_output=True,
-                text=True,
+                capture_output=True,  # Raw bytes; decoded once below
                 timeout=3600,  # 1 hour max
             )
 
@@ -208,14 +204,15 @@ Return a summary when done."""
                 logger.info("Orchestrator completed successfully")
                 return {
                     "success": True,
-                    "output": result.stdout,
+                    "output": result.stdout.decode("utf-8", errors="replace"),
                     "session_id": manifest["session_id"],
                 }
             else:
-                logger.error(f"Orchestrator failed: {result.stderr}")
+                error = result.stderr.decode("utf-8", errors="replace")
+                logger.error(f"Orchestrator failed: {error}")
                 return {
                     "success": False,
-                    "error": result.stderr,
+                    "error": error,
                     "session_id": manifest["session_id"],
                 }
 
@@ -272,11 +269,9 @@ Return a summary when done."""
         else:
             gitignore.write_text(f"{entry}\n")
 
-    def _generate_session_id(self) -> str:
-        """Generate a unique session ID."""
-        import uuid
-
-        return f"sess_{uuid.uuid4().hex[:12]}"
+    def _generate_session_id(self, rng: Callable[[int], bytes] = os.urandom) -> str:
+        """Generate a unique session ID from 6 random bytes (12 hex digits)."""
+        return f"sess_{rng(6).hex()}"
 
 
 def run_single_session_workflow(
@@ -1,4 +1,5 @@
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Optional
@@ -7,6 +8,7 @@ from agentic_builder.agents.configs import get_agent_config
 from agentic_builder.common.events import EventEmitter
 from agentic_builder.common.logging_config import get_logger, log_separator, truncate_for_log
 from agentic_builder.common.types import WorkflowStatus
+from agentic_builder.common.utils import resolve_within
 from agentic_builder.orchestration.session_manager import SessionManager
 from agentic_builder.orchestration.workflows import WorkflowMapper
 from agentic_builder.pms.context_serializer import ContextSerializer
@@ -200,6 +202,10 @@ class WorkflowEngine(EventEmitter):
         debug_logger.debug(f"Already completed agents: {[a.value for a in completed_agents]}")
         debug_logger.debug(f"Agent-Task mapping: {[(a.value, t) for a, t in agent_task_map.items()]}")
 
+        # Use output_dir as project root for all file operations; resolved once per run
+        root_dir = str(self.session_manager.output_dir.resolve())
+        debug_logger.debug(f"Project root path: {root_dir}")
+
         for agent_type in execution_order:
             if session_id not in self._active_runs:
                 debug_logger.debug(f"Session {session_id} cancelled, stopping execution loop")
@@ -267,31 +273,23 @@ class WorkflowEngine(EventEmitter):
             if response.success:
                 debug_logger.debug(f"Processing successful response for agent {agent_type.value}")
                 created_files = []
-                # Use output_dir as project root for all file operations
-                root_path = self.session_manager.output_dir.resolve()
-                debug_logger.debug(f"Project root path: {root_path}")
 
                 debug_logger.debug(f"Processing {len(response.artifacts)} artifacts...")
                 for artifact in response.artifacts:
                     if artifact.type == "file" and artifact.path:
                         # New format: agent already wrote file, we just validate and track
                         # Resolve path relative to project root, not CWD
-                        artifact_path = Path(artifact.path)
-                        if artifact_path.is_absolute():
-                            fpath = artifact_path.resolve()
-                        else:
-                            fpath = (root_path / artifact_path).resolve()
-
+                        fpath = resolve_within(root_dir, artifact.path)
                         debug_logger.debug(f"  Checking artifact: {artifact.path} -> {fpath}")
 
-                        if not fpath.is_relative_to(root_path):
-                            logger.error(f"Security: Agent reported file outside repo: {fpath}")
-                            debug_logger.error(f"SECURITY: Path traversal attempt: {fpath}")
+                        if fpath is None:
+                            logger.error(f"Security: Agent reported file outside repo: {artifact.path}")
+                            debug_logger.error(f"SECURITY: Path traversal attempt: {artifact.path}")
                             continue
 
                         # Verify file exists (agent should have created it)
-                        if fpath.exists():
-                            created_files.append(str(fpath))
+                        if os.path.exists(fpath):
+                            created_files.append(fpath)
                             logger.info(f"Agent {artifact.action or 'created'} file: {fpath}")
                             debug_logger.debug(f"  File verified: {fpath}")
                         else:
@@ -301,21 +299,16 @@ class WorkflowEngine(EventEmitter):
                     elif artifact.type == "file" and artifact.content:
                         # Legacy fallback: write content if provided (backwards compatibility)
                         debug_logger.debug(f"  Processing legacy artifact with content: {artifact.name}")
-                        artifact_path = Path(artifact.name)
-                        if artifact_path.is_absolute():
-                            fpath = artifact_path.resolve()
-                        else:
-                            fpath = (root_path / artifact_path).resolve()
+                        fpath = resolve_within(root_dir, artifact.name)
 
-                        if not fpath.is_relative_to(root_path):
-                            logger.error(f"Security: Attempted path traversal write to {fpath}")
-                            debug_logger.error(f"SECURITY: Path traversal attempt: {fpath}")
+                        if fpath is None:
+                            logger.error(f"Security: Attempted path traversal write to {artifact.name}")
+                            debug_logger.error(f"SECURITY: Path traversal attempt: {artifact.name}")
                             continue
 
-                        if fpath.parent:
-                            fpath.parent.mkdir(parents=True, exist_ok=True)
-                        fpath.write_text(artifact.content)
-                        created_files.append(str(fpath))
+                        os.makedirs(os.path.dirname(fpath), exist_ok=True)
+                        Path(fpath).write_text(artifact.content)
+                        created_files.append(fpath)
                         debug_logger.debug(f"  Wrote legacy file: {fpath} ({len(artifact.content)} chars)")
 
                 debug_logger.debug(f"Total files created/modified: {len(created_files)}")
@@ -1,8 +1,10 @@
+import heapq
 from enum import Enum
-from typing import Dict, List
+from graphlib import TopologicalSorter
+from typing import Dict, List, Tuple
 
 from agentic_builder.agents.configs import get_agent_config
-from agentic_builder.common.types import AgentType
+from agentic_builder.common.types import ALL_AGENT_TYPES, AgentType, resolve_agent_type
 
 
 class WorkflowType(str, Enum):
@@ -17,7 +19,7 @@ class WorkflowType(str, Enum):
 
 # Define which agents participate in each workflow
 WORKFLOW_TEMPLATES: Dict[WorkflowType, List[AgentType]] = {
-    WorkflowType.FULL_APP_GENERATION: list(AgentType),  # All agents
+    WorkflowType.FULL_APP_GENERATION: list(ALL_AGENT_TYPES),  # All agents
     WorkflowType.FEATURE_ADDITION: [
         AgentType.PM,
         AgentType.ARCHITECT,
@@ -55,8 +57,21 @@ WORKFLOW_TEMPLATES: Dict[WorkflowType, List[AgentType]] = {
 
 
 class WorkflowMapper:
+    # Sorted agents per WorkflowType. WorkflowType is a str enum, so its string values hit the same entries.
+    _ORDERS: Dict[WorkflowType, Tuple[AgentType, ...]] = {}
+
     @staticmethod
-    def get_execution_order(workflow_type: str) -> List[AgentType]:
+    def get_execution_order(workflow_type: str) -> Tuple[AgentType, ...]:
+        """
+        Return the dependency-sorted agents for a workflow.
+
+        Workflow templates are fixed at runtime, so the sort runs once per
+        workflow; the cached result is an immutable tuple shared by all callers.
+        """
+        order = WorkflowMapper._ORDERS.get(workflow_type)
+        if order is not None:
+            return order
+
         # Handle string input from CLI
         try:
             w_type = WorkflowType(workflow_type)
@@ -69,54 +84,48 @@ class WorkflowMapper:
             else:
                 w_type = WorkflowType.FULL_APP_GENERATION  # Default? Or raise.
 
-        agents = WORKFLOW_TEMPLATES.get(w_type, [])
-        return WorkflowMapper.topological_sort(agents)
+        order = WorkflowMapper._ORDERS.get(w_type)
+        if order is None:
+            order = tuple(WorkflowMapper.topological_sort(WORKFLOW_TEMPLATES.get(w_type, [])))
+            WorkflowMapper._ORDERS[w_type] = order
+        return order
 
     @staticmethod
     def topological_sort(agents: List[AgentType]) -> List[AgentType]:
         """
         Sorts the provided list of agents based on the dependency graph in AGENT_CONFIGS.
         Only considers dependencies that are present in the input list.
-        """
-        # Build adjacency list for the subset
-        # adj: Dict[AgentType, Set[AgentType]] = {a: set() for a in agents}
 
-        # Populate dependencies
+        Of the agents whose dependencies are done, the one listed earliest in
+        ``agents`` runs next, so a template already in dependency order comes
+        back unchanged. A dependency cycle raises graphlib.CycleError, a
+        ValueError subclass.
+        """
+        sorter = TopologicalSorter()
+        position: Dict[AgentType, int] = {}
         for agent in agents:
-            config = get_agent_config(agent)
-            for dep in config.dependencies:
-                if dep in agents:
-                    # dep must come before agent
-                    # so dependency edge is dep -> agent
-                    # For topo sort, we usually track incoming edges (dependencies)
-                    pass
-
-        # Standard Kahn's algorithm or DFS
-        # Let's use simple DFS post-order (reverse) or just dependency counting
-
-        # State: 0=unvisited, 1=visiting, 2=visited
-        state = {a: 0 for a in agents}
+            if agent not in position:
+                position[agent] = len(position)
+                sorter.add(agent)
+        # Configs name the new agent types; let them match legacy aliases listed in a template
+        aliased = {resolve_agent_type(a): a for a in position if resolve_agent_type(a) is not a}
+        for agent in position:
+            for dep in get_agent_config(agent).dependencies:
+                if dep not in position:
+                    dep = aliased.get(dep)
+                    if dep is None:
+                        continue
+                sorter.add(agent, dep)
+        sorter.prepare()
+
+        # Ready agents keyed by template position, so ties never reorder the template
+        ready = [(position[agent], agent) for agent in sorter.get_ready()]
+        heapq.heapify(ready)
         result = []
-
-        def visit(node):
-            if state[node] == 1:
-                raise ValueError("Cycle detected in agent dependencies")
-            if state[node] == 2:
-                return
-
-            state[node] = 1
-
-            # Visit dependencies first
-            config = get_agent_config(node)
-            for dep in config.dependencies:
-                if dep in agents:
-                    visit(dep)
-
-            state[node] = 2
-            result.append(node)
-
-        for agent in agents:
-            if state[agent] == 0:
-                visit(agent)
-
+        while ready:
+            _, agent = heapq.heappop(ready)
+            result.append(agent)
+            sorter.done(agent)
+            for nxt in sorter.get_ready():
+                heapq.heappush(ready, (position[nxt], nxt))
         return result
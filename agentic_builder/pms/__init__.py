@@ -1,13 +1,45 @@
-"""Project Management System (PMS) - Task and context management."""
+"""Project Management System (PMS) - Task and context management.
 
-from agentic_builder.pms.context_serializer import ContextSerializer
-from agentic_builder.pms.minimal_context import MinimalContextSerializer
-from agentic_builder.pms.task_file_store import TaskFileStore
-from agentic_builder.pms.task_manager import TaskManager
+Submodules are imported lazily (PEP 562) so that importing one component,
+e.g. ``from agentic_builder.pms import TaskFileStore``, does not pay for the
+others.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # Static analysers see the real names; runtime goes through __getattr__
+    from agentic_builder.pms.context_serializer import ContextSerializer
+    from agentic_builder.pms.minimal_context import MinimalContextSerializer
+    from agentic_builder.pms.task_file_store import TaskFileStore
+    from agentic_builder.pms.task_manager import TaskManager, TaskSpec
 
 __all__ = [
+    "TaskFileStore",
     "TaskManager",
+    "TaskSpec",
     "ContextSerializer",
-    "TaskFileStore",
     "MinimalContextSerializer",
 ]
+
+# Public name -> submodule that defines it, ordered from fewest to most dependencies
+_LAZY = {
+    "TaskFileStore": "agentic_builder.pms.task_file_store",
+    "TaskManager": "agentic_builder.pms.task_manager",
+    "TaskSpec": "agentic_builder.pms.task_manager",
+    "ContextSerializer": "agentic_builder.pms.context_serializer",
+    "MinimalContextSerializer": "agentic_builder.pms.minimal_context",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Cache so __getattr__ is only hit once per name
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
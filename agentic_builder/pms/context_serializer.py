@@ -1,22 +1,130 @@
-from typing import Dict, Optional
+import logging
+from types import MappingProxyType
+from typing import Callable, Dict, Iterator, Mapping, Optional, Tuple
 
 from agentic_builder.common.logging_config import get_logger, log_separator
-from agentic_builder.common.types import Task
+from agentic_builder.common.types import AgentType, Task
+from agentic_builder.pms._xml_escape import escape_xml
 
 # Module logger
 logger = get_logger(__name__)
 
+# Fixed structural lines, shared by every call
+_HEADER = "<task_context>\n"
+_FOOTER = "</task_context>"
+_DEPS_OPEN = "  <dependencies>\n"
+_DEPS_CLOSE = "  </dependencies>\n"
+_DEP_CLOSE = "    </dependency>\n"
+_ARTIFACTS_OPEN = "      <artifacts>\n"
+_ARTIFACTS_CLOSE = "      </artifacts>\n"
+_STEPS_OPEN = "      <next_steps>\n"
+_STEPS_CLOSE = "      </next_steps>\n"
+_WARNINGS_OPEN = "      <warnings>\n"
+_WARNINGS_CLOSE = "      </warnings>\n"
+_FILES_OPEN = "  <files>\n"
+_FILES_CLOSE = "  </files>\n"
+
+# Templates, filled with str.format; list items are joined into one chunk per block
+_IDEA = "  <project_idea>\n    {0}\n  </project_idea>\n"
+_TASK_INFO = "  <task_id>{0}</task_id>\n{1}  <description>{2}</description>\n"
+_LEAF = _HEADER + _TASK_INFO + _FOOTER
+_DEP_OPEN = "    <dependency id='{0}' agent='{1}'>\n"
+_SUMMARY = "      <summary>{0}</summary>\n"
+_ARTIFACT = "        <artifact path='{0}'/>\n"
+_STEP = "        <step>{0}</step>\n"
+_WARNING = "        <warning>{0}</warning>\n"
+_FILE = "    <file path='{0}'/>\n"
+
+# Shared read-only default, so calls without dependencies allocate no dict
+_NO_DEPS: Mapping[str, Task] = MappingProxyType({})
+
+# AgentType is a closed enum, so its label and role tag are rendered once at import
+_AGENT_NAME: Dict[AgentType, str] = {a: a.value for a in AgentType}
+_AGENT_ROLE: Dict[AgentType, str] = {a: f"  <agent_role>{name}</agent_role>\n" for a, name in _AGENT_NAME.items()}
+
+
+def _dep_summary(dep_task: Task) -> str:
+    summary = dep_task.output_summary
+    return _SUMMARY.format(escape_xml(summary)) if summary else ""
+
+
+def _dep_artifacts(dep_task: Task) -> str:
+    # File paths only; agents read the content from disk if they need it
+    files = dep_task.context_files
+    if not files:
+        return ""
+    return _ARTIFACTS_OPEN + "".join([_ARTIFACT.format(fpath) for fpath in files]) + _ARTIFACTS_CLOSE
+
+
+def _dep_next_steps(dep_task: Task) -> str:
+    steps = dep_task.output_next_steps
+    if not steps:
+        return ""
+    return _STEPS_OPEN + "".join([_STEP.format(escape_xml(step)) for step in steps]) + _STEPS_CLOSE
+
+
+def _dep_warnings(dep_task: Task) -> str:
+    warnings = dep_task.output_warnings
+    if not warnings:
+        return ""
+    return _WARNINGS_OPEN + "".join([_WARNING.format(escape_xml(w)) for w in warnings]) + _WARNINGS_CLOSE
+
+
+# Sections of each <dependency>, in document order; each renders "" when its field is empty
+_DEP_SECTIONS: Tuple[Callable[[Task], str], ...] = (_dep_summary, _dep_artifacts, _dep_next_steps, _dep_warnings)
+
+
+def _log_dependency(dep_id: str, dep_task: Task):
+    logger.debug("Adding dependency: %s (agent: %s)", dep_id, _AGENT_NAME[dep_task.agent_type])
+    if dep_task.output_summary:
+        logger.debug("  - Summary: %s...", dep_task.output_summary[:100])
+    if dep_task.context_files:
+        logger.debug("  - Artifacts: %d files", len(dep_task.context_files))
+        for fpath in dep_task.context_files:
+            logger.debug("    - %s", fpath)
+    if dep_task.output_next_steps:
+        logger.debug("  - Next steps: %d items", len(dep_task.output_next_steps))
+    if dep_task.output_warnings:
+        logger.debug("  - Warnings: %d items", len(dep_task.output_warnings))
+
 
 class ContextSerializer:
     @staticmethod
     def serialize(
         task: Task,
-        dependency_tasks: Dict[str, Task] = None,
+        dependency_tasks: Mapping[str, Task] = _NO_DEPS,
         project_idea: Optional[str] = None,
     ) -> str:
         """
         Serialize task context to XML format.
 
+        See iter_serialize() for the layout; this joins its chunks into one string.
+        """
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        # Leaf tasks with nothing optional to render skip the generator entirely.
+        # The description is emitted as-is, same as in iter_serialize().
+        if not dependency_tasks and not task.context_files and not project_idea and not debug:
+            return _LEAF.format(task.id, _AGENT_ROLE[task.agent_type], task.description)
+
+        # Joining a list is faster than joining the generator directly
+        result = "".join(list(ContextSerializer.iter_serialize(task, dependency_tasks, project_idea)))
+        if debug:
+            logger.debug("Serialized context length: %d characters", len(result))
+        return result
+
+    @staticmethod
+    def iter_serialize(
+        task: Task,
+        dependency_tasks: Mapping[str, Task] = _NO_DEPS,
+        project_idea: Optional[str] = None,
+    ) -> Iterator[str]:
+        """
+        Yield the task context XML chunk by chunk.
+
+        Callers writing to a file or socket can consume this directly instead
+        of materializing the whole document with serialize().
+
         Includes:
         - Project idea (if provided - passed to first agent like PM)
         - Task info (id, role, description)
@@ -25,91 +133,42 @@ class ContextSerializer:
         Note: We only include file paths, not content. Agents can read files
         directly from disk if they need the content.
         """
-        log_separator(logger, "SERIALIZING CONTEXT", char="-")
-        logger.debug(f"Task ID: {task.id}")
-        logger.debug(f"Agent Type: {task.agent_type.value}")
-        logger.debug(f"Description: {task.description}")
-        if project_idea:
-            idea_preview = f"{project_idea[:100]}..." if len(project_idea) > 100 else project_idea
-            logger.debug(f"Project Idea: {idea_preview}")
-
-        if dependency_tasks is None:
-            dependency_tasks = {}
-
-        logger.debug(f"Number of dependency tasks: {len(dependency_tasks)}")
-
-        xml = ["<task_context>"]
+        # Skip all log formatting unless debug logging is actually on
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            log_separator(logger, "SERIALIZING CONTEXT", char="-")
+            logger.debug("Task ID: %s", task.id)
+            logger.debug("Agent Type: %s", _AGENT_NAME[task.agent_type])
+            logger.debug("Description: %s", task.description)
+            if project_idea:
+                idea_preview = f"{project_idea[:100]}..." if len(project_idea) > 100 else project_idea
+                logger.debug("Project Idea: %s", idea_preview)
+            logger.debug("Number of dependency tasks: %d", len(dependency_tasks) if dependency_tasks else 0)
+
+        escape = escape_xml
+        yield _HEADER
 
         # Include project idea at the top for agents to understand what to build
         if project_idea:
-            xml.append("  <project_idea>")
-            xml.append(f"    {_escape_xml(project_idea)}")
-            xml.append("  </project_idea>")
+            yield _IDEA.format(escape(project_idea))
 
-        xml.append(f"  <task_id>{task.id}</task_id>")
-        xml.append(f"  <agent_role>{task.agent_type.value}</agent_role>")
-        xml.append(f"  <description>{task.description}</description>")
+        yield _TASK_INFO.format(task.id, _AGENT_ROLE[task.agent_type], task.description)
 
         if dependency_tasks:
-            xml.append("  <dependencies>")
+            yield _DEPS_OPEN
             for dep_id, dep_task in dependency_tasks.items():
-                logger.debug(f"Adding dependency: {dep_id} (agent: {dep_task.agent_type.value})")
-                xml.append(f"    <dependency id='{dep_id}' agent='{dep_task.agent_type.value}'>")
-
-                # Include the agent's summary
-                if dep_task.output_summary:
-                    logger.debug(f"  - Summary: {dep_task.output_summary[:100]}...")
-                    xml.append(f"      <summary>{_escape_xml(dep_task.output_summary)}</summary>")
-
-                # Include artifacts (file paths only)
-                if dep_task.context_files:
-                    logger.debug(f"  - Artifacts: {len(dep_task.context_files)} files")
-                    xml.append("      <artifacts>")
-                    for fpath in dep_task.context_files:
-                        logger.debug(f"    - {fpath}")
-                        xml.append(f"        <artifact path='{fpath}'/>")
-                    xml.append("      </artifacts>")
-
-                # Include next steps
-                if dep_task.output_next_steps:
-                    logger.debug(f"  - Next steps: {len(dep_task.output_next_steps)} items")
-                    xml.append("      <next_steps>")
-                    for step in dep_task.output_next_steps:
-                        xml.append(f"        <step>{_escape_xml(step)}</step>")
-                    xml.append("      </next_steps>")
-
-                # Include warnings
-                if dep_task.output_warnings:
-                    logger.debug(f"  - Warnings: {len(dep_task.output_warnings)} items")
-                    xml.append("      <warnings>")
-                    for warning in dep_task.output_warnings:
-                        xml.append(f"        <warning>{_escape_xml(warning)}</warning>")
-                    xml.append("      </warnings>")
-
-                xml.append("    </dependency>")
-            xml.append("  </dependencies>")
+                if debug:
+                    _log_dependency(dep_id, dep_task)
+                body = "".join([build(dep_task) for build in _DEP_SECTIONS])
+                yield _DEP_OPEN.format(dep_id, _AGENT_NAME[dep_task.agent_type]) + body + _DEP_CLOSE
+            yield _DEPS_CLOSE
 
         # Add file context if any (for this task specifically)
         if task.context_files:
-            logger.debug(f"Adding task context files: {len(task.context_files)} files")
-            xml.append("  <files>")
-            for f in task.context_files:
-                logger.debug(f"  - {f}")
-                xml.append(f"    <file path='{f}'/>")
-            xml.append("  </files>")
-
-        xml.append("</task_context>")
-        result = "\n".join(xml)
-        logger.debug(f"Serialized context length: {len(result)} characters")
-        return result
-
+            if debug:
+                logger.debug("Adding task context files: %d files", len(task.context_files))
+                for f in task.context_files:
+                    logger.debug("  - %s", f)
+            yield _FILES_OPEN + "".join([_FILE.format(f) for f in task.context_files]) + _FILES_CLOSE
 
-def _escape_xml(text: str) -> str:
-    """Escape special XML characters."""
-    return (
-        text.replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-        .replace('"', "&quot;")
-        .replace("'", "&apos;")
-    )
+        yield _FOOTER
@@ -11,9 +11,102 @@ Token Comparison:
 Agents are instructed to read .tasks/ files directly for the context they need.
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from agentic_builder.common.types import AgentType
+from agentic_builder.pms._xml_escape import escape_xml
+
+# Universal reads for every agent
+_BASE_READS = (".tasks/manifest.json",)
+
+# Agent-specific recommendations
+_RECOMMENDED_READS = {
+    AgentType.ARCHITECT: [
+        ".tasks/PM/output.json",
+        ".tasks/PM/artifacts.json",
+    ],
+    AgentType.UIUX_GUI: [
+        ".tasks/PM/output.json",
+    ],
+    AgentType.UIUX_CLI: [
+        ".tasks/PM/output.json",
+    ],
+    AgentType.TL_UI_WEB: [
+        ".tasks/ARCHITECT/output.json",
+        ".tasks/ARCHITECT/decisions.json",
+        ".tasks/UIUX_GUI/output.json",
+    ],
+    AgentType.TL_UI_MOBILE: [
+        ".tasks/ARCHITECT/output.json",
+        ".tasks/ARCHITECT/decisions.json",
+        ".tasks/UIUX_GUI/output.json",
+    ],
+    AgentType.TL_UI_DESKTOP: [
+        ".tasks/ARCHITECT/output.json",
+        ".tasks/ARCHITECT/decisions.json",
+        ".tasks/UIUX_GUI/output.json",
+    ],
+    AgentType.TL_UI_CLI: [
+        ".tasks/ARCHITECT/output.json",
+        ".tasks/ARCHITECT/decisions.json",
+        ".tasks/UIUX_CLI/output.json",
+    ],
+    AgentType.TL_CORE_API: [
+        ".tasks/ARCHITECT/output.json",
+        ".tasks/ARCHITECT/decisions.json",
+    ],
+    AgentType.TL_CORE_SYSTEMS: [
+        ".tasks/ARCHITECT/output.json",
+        ".tasks/ARCHITECT/decisions.json",
+    ],
+    AgentType.TL_CORE_LIBRARY: [
+        ".tasks/ARCHITECT/output.json",
+        ".tasks/ARCHITECT/decisions.json",
+    ],
+    AgentType.TEST: [
+        ".tasks/ARCHITECT/decisions.json",
+    ],
+    AgentType.CQR: [
+        ".tasks/ARCHITECT/decisions.json",
+    ],
+    AgentType.SR: [
+        ".tasks/ARCHITECT/decisions.json",
+    ],
+    AgentType.DOE: [
+        ".tasks/ARCHITECT/decisions.json",
+    ],
+}
+
+# DEV agents read from their TL
+_DEV_TO_TL = {
+    AgentType.DEV_UI_WEB: AgentType.TL_UI_WEB,
+    AgentType.DEV_UI_MOBILE: AgentType.TL_UI_MOBILE,
+    AgentType.DEV_UI_DESKTOP: AgentType.TL_UI_DESKTOP,
+    AgentType.DEV_UI_CLI: AgentType.TL_UI_CLI,
+    AgentType.DEV_CORE_API: AgentType.TL_CORE_API,
+    AgentType.DEV_CORE_SYSTEMS: AgentType.TL_CORE_SYSTEMS,
+    AgentType.DEV_CORE_LIBRARY: AgentType.TL_CORE_LIBRARY,
+}
+
+
+def _build_recommended_reads(agent_type: AgentType) -> Tuple[str, ...]:
+    reads = list(_BASE_READS)
+    if agent_type in _DEV_TO_TL:
+        tl = _DEV_TO_TL[agent_type]
+        reads.extend(
+            [
+                f".tasks/{tl.value}/output.json",
+                f".tasks/{tl.value}/artifacts.json",
+                ".tasks/ARCHITECT/decisions.json",
+            ]
+        )
+    elif agent_type in _RECOMMENDED_READS:
+        reads.extend(_RECOMMENDED_READS[agent_type])
+    return tuple(reads)
+
+
+# Recommendations are static per agent type, so resolve them once at import time
+_READS_BY_AGENT: Dict[AgentType, Tuple[str, ...]] = {a: _build_recommended_reads(a) for a in AgentType}
 
 
 class MinimalContextSerializer:
@@ -45,7 +138,7 @@ class MinimalContextSerializer:
             return f"""<task>
   <agent>{agent_type.value}</agent>
   <manifest>.tasks/manifest.json</manifest>
-  <project_idea>{_escape_xml(project_idea)}</project_idea>
+  <project_idea>{escape_xml(project_idea)}</project_idea>
 </task>"""
 
         return f"""<task>
@@ -88,99 +181,4 @@ class MinimalContextSerializer:
 
         This helps agents know what to prioritize reading.
         """
-        # Universal reads
-        reads = [".tasks/manifest.json"]
-
-        # Agent-specific recommendations
-        recommendations = {
-            AgentType.ARCHITECT: [
-                ".tasks/PM/output.json",
-                ".tasks/PM/artifacts.json",
-            ],
-            AgentType.UIUX_GUI: [
-                ".tasks/PM/output.json",
-            ],
-            AgentType.UIUX_CLI: [
-                ".tasks/PM/output.json",
-            ],
-            AgentType.TL_UI_WEB: [
-                ".tasks/ARCHITECT/output.json",
-                ".tasks/ARCHITECT/decisions.json",
-                ".tasks/UIUX_GUI/output.json",
-            ],
-            AgentType.TL_UI_MOBILE: [
-                ".tasks/ARCHITECT/output.json",
-                ".tasks/ARCHITECT/decisions.json",
-                ".tasks/UIUX_GUI/output.json",
-            ],
-            AgentType.TL_UI_DESKTOP: [
-                ".tasks/ARCHITECT/output.json",
-                ".tasks/ARCHITECT/decisions.json",
-                ".tasks/UIUX_GUI/output.json",
-            ],
-            AgentType.TL_UI_CLI: [
-                ".tasks/ARCHITECT/output.json",
-                ".tasks/ARCHITECT/decisions.json",
-                ".tasks/UIUX_CLI/output.json",
-            ],
-            AgentType.TL_CORE_API: [
-                ".tasks/ARCHITECT/output.json",
-                ".tasks/ARCHITECT/decisions.json",
-            ],
-            AgentType.TL_CORE_SYSTEMS: [
-                ".tasks/ARCHITECT/output.json",
-                ".tasks/ARCHITECT/decisions.json",
-            ],
-            AgentType.TL_CORE_LIBRARY: [
-                ".tasks/ARCHITECT/output.json",
-                ".tasks/ARCHITECT/decisions.json",
-            ],
-            AgentType.TEST: [
-                ".tasks/ARCHITECT/decisions.json",
-            ],
-            AgentType.CQR: [
-                ".tasks/ARCHITECT/decisions.json",
-            ],
-            AgentType.SR: [
-                ".tasks/ARCHITECT/decisions.json",
-            ],
-            AgentType.DOE: [
-                ".tasks/ARCHITECT/decisions.json",
-            ],
-        }
-
-        # DEV agents read from their TL
-        dev_to_tl = {
-            AgentType.DEV_UI_WEB: AgentType.TL_UI_WEB,
-            AgentType.DEV_UI_MOBILE: AgentType.TL_UI_MOBILE,
-            AgentType.DEV_UI_DESKTOP: AgentType.TL_UI_DESKTOP,
-            AgentType.DEV_UI_CLI: AgentType.TL_UI_CLI,
-            AgentType.DEV_CORE_API: AgentType.TL_CORE_API,
-            AgentType.DEV_CORE_SYSTEMS: AgentType.TL_CORE_SYSTEMS,
-            AgentType.DEV_CORE_LIBRARY: AgentType.TL_CORE_LIBRARY,
-        }
-
-        if agent_type in dev_to_tl:
-            tl = dev_to_tl[agent_type]
-            reads.extend(
-                [
-                    f".tasks/{tl.value}/output.json",
-                    f".tasks/{tl.value}/artifacts.json",
-                    ".tasks/ARCHITECT/decisions.json",
-                ]
-            )
-        elif agent_type in recommendations:
-            reads.extend(recommendations[agent_type])
-
-        return reads
-
-
-def _escape_xml(text: str) -> str:
-    """Escape special XML characters."""
-    return (
-        text.replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-        .replace('"', "&quot;")
-        .replace("'", "&apos;")
-    )
+        return list(_READS_BY_AGENT.get(agent_type, _BASE_READS))
@@ -17,14 +17,17 @@ Directory Structure:
         ...
 """
 
+import copy
 import fcntl
-import json
-from datetime import datetime
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Sequence
 
 from agentic_builder.common.logging_config import get_logger
 from agentic_builder.common.types import AgentType
+from agentic_builder.common.utils import dumps_json, loads_json, utc_timestamp
 
 logger = get_logger(__name__)
 
@@ -33,10 +36,29 @@ class TaskFileStore:
     """File-based task context store for efficient agent communication."""
 
     TASKS_DIR = ".tasks"
-
-    def __init__(self, project_root: Path):
+    # Dependency reads are fanned out to a shared pool only when there are enough of them
+    PARALLEL_READ_MIN_DEPS = 3
+    _IO_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="task-store-io")
+
+    def __init__(self, project_root: Path, parallel_safe: bool = False):
+        """
+        Args:
+            project_root: Project directory that holds the .tasks/ store
+            parallel_safe: Serialize manifest updates across processes with an
+                exclusive flock. Not needed when a single process owns the store
+                (the default), where it would only add syscalls per update.
+        """
         self.project_root = Path(project_root)
         self.tasks_dir = self.project_root / self.TASKS_DIR
+        self.parallel_safe = parallel_safe
+        self._manifest_path = self.tasks_dir / "manifest.json"
+        # Parsed manifest plus the (inode, mtime_ns, size) it was read at / written with
+        self._manifest_cache: Optional[Dict[str, Any]] = None
+        self._manifest_stamp: Optional[tuple] = None
+        # Outputs written by this instance, keyed by agent name (saves re-reading them)
+        self._output_cache: Dict[str, Dict[str, Any]] = {}
+        self._artifacts_cache: Dict[str, List[str]] = {}
+        self._decisions_cache: Dict[str, Dict[str, Any]] = {}
         self._ensure_gitignore()
 
     def _ensure_gitignore(self):
@@ -57,7 +79,7 @@ class TaskFileStore:
         session_id: str,
         workflow: str,
         project_idea: str,
-        agents: List[AgentType],
+        agents: Sequence[AgentType],
     ) -> None:
         """Initialize task store for a new session."""
         self.tasks_dir.mkdir(parents=True, exist_ok=True)
@@ -66,7 +88,7 @@ class TaskFileStore:
             "session_id": session_id,
             "workflow": workflow,
             "project_idea": project_idea,
-            "created_at": datetime.utcnow().isoformat() + "Z",
+            "created_at": utc_timestamp(),
             "agents": [a.value for a in agents],
             "tasks": {},
             "completed": [],
@@ -79,34 +101,85 @@ class TaskFileStore:
 
     def get_manifest(self) -> Dict[str, Any]:
         """Read the session manifest."""
-        manifest_path = self.tasks_dir / "manifest.json"
-        if not manifest_path.exists():
+        return copy.deepcopy(self._load_manifest())
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        """
+        Return the cached manifest, re-reading it only if the file changed on disk.
+
+        The returned dict is the cache itself and must not be mutated; change the
+        manifest through _update_manifest() instead.
+        """
+        try:
+            stamp = self._stat_stamp(self._manifest_path)
+        except FileNotFoundError:
+            self._manifest_cache = self._manifest_stamp = None
             return {}
-        return self._read_json_with_lock(manifest_path)
+
+        if self._manifest_cache is None or stamp != self._manifest_stamp:
+            self._manifest_cache = self._read_json(self._manifest_path)
+            self._manifest_stamp = stamp
+        return self._manifest_cache
 
     def _write_manifest(self, manifest: Dict[str, Any]) -> None:
-        """Write manifest with file locking for parallel safety."""
-        manifest_path = self.tasks_dir / "manifest.json"
-        self._write_json_with_lock(manifest_path, manifest)
+        """Write the manifest and refresh the cache."""
+        try:
+            self._write_json(self._manifest_path, manifest)
+            self._manifest_stamp = self._stat_stamp(self._manifest_path)
+        except Exception:
+            self._manifest_cache = self._manifest_stamp = None
+            raise
+        self._manifest_cache = manifest
+
+    @contextmanager
+    def _manifest_lock(self) -> Iterator[None]:
+        """Hold an exclusive lock around a manifest read-modify-write (parallel_safe only)."""
+        if not self.parallel_safe:
+            yield
+            return
+
+        self.tasks_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.tasks_dir / "manifest.lock", "a") as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    @contextmanager
+    def _update_manifest(self) -> Iterator[Dict[str, Any]]:
+        """
+        Read-modify-write the manifest under _manifest_lock().
+
+        Yields a private copy of the manifest. It is written back, and replaces
+        the cache, only if the block completes, so an exception part-way through
+        an update leaves both the file and the cache untouched.
+        """
+        with self._manifest_lock():
+            manifest = copy.deepcopy(self._load_manifest())
+            yield manifest
+            self._write_manifest(manifest)
+
+    @staticmethod
+    def _stat_stamp(path: Path) -> tuple:
+        st = os.stat(path)
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
 
     def start_task(self, agent_type: AgentType) -> None:
         """Mark a task as in-progress."""
-        manifest = self.get_manifest()
         agent_name = agent_type.value
-
-        # Update manifest state
-        if agent_name in manifest.get("pending", []):
-            manifest["pending"].remove(agent_name)
-        if agent_name not in manifest.get("in_progress", []):
-            manifest["in_progress"].append(agent_name)
-
-        # Create task entry
-        manifest.setdefault("tasks", {})[agent_name] = {
-            "status": "in_progress",
-            "started_at": datetime.utcnow().isoformat() + "Z",
-        }
-
-        self._write_manifest(manifest)
+        with self._update_manifest() as manifest:
+            # Update manifest state
+            if agent_name in manifest.get("pending", []):
+                manifest["pending"].remove(agent_name)
+            if agent_name not in manifest.get("in_progress", []):
+                manifest["in_progress"].append(agent_name)
+
+            # Create task entry
+            manifest.setdefault("tasks", {})[agent_name] = {
+                "status": "in_progress",
+                "started_at": utc_timestamp(),
+            }
 
         # Create agent directory
         agent_dir = self.tasks_dir / agent_name
@@ -126,95 +199,107 @@ class TaskFileStore:
         """Complete a task and store its outputs."""
         agent_name = agent_type.value
         agent_dir = self.tasks_dir / agent_name
-        agent_dir.mkdir(parents=True, exist_ok=True)
+        now = utc_timestamp()  # Same completion time in output.json and the manifest
 
-        # Write output.json
+        # Build all payloads before touching disk
         output = {
             "summary": summary,
-            "next_steps": next_steps or [],
-            "warnings": warnings or [],
-            "completed_at": datetime.utcnow().isoformat() + "Z",
+            "next_steps": list(next_steps or []),
+            "warnings": list(warnings or []),
+            "completed_at": now,
         }
-        self._write_json_with_lock(agent_dir / "output.json", output)
-
-        # Write artifacts.json
-        self._write_json_with_lock(agent_dir / "artifacts.json", {"files": artifacts})
-
-        # Write decisions.json if provided (for ARCHITECT, TL_* agents)
-        if decisions:
-            self._write_json_with_lock(agent_dir / "decisions.json", decisions)
-
-        # Update manifest
-        manifest = self.get_manifest()
-        if agent_name in manifest.get("in_progress", []):
-            manifest["in_progress"].remove(agent_name)
-        if agent_name not in manifest.get("completed", []):
-            manifest["completed"].append(agent_name)
-
-        manifest["tasks"][agent_name].update(
-            {
-                "status": "completed",
-                "completed_at": datetime.utcnow().isoformat() + "Z",
-                "tokens_used": tokens_used,
-                "artifact_count": len(artifacts),
-            }
-        )
-
-        self._write_manifest(manifest)
+        files = list(artifacts)
+
+        # Single manifest read-modify-write, served from the cache when unchanged on disk
+        with self._update_manifest() as manifest:
+            # Check before any write: an agent that was never started has no task entry
+            task_entry = manifest["tasks"][agent_name]
+
+            # Agent files go first so a reader never sees "completed" without outputs;
+            # _write_json creates agent_dir if start_task did not
+            self._write_json(agent_dir / "output.json", output)
+            self._write_json(agent_dir / "artifacts.json", {"files": files})
+            if decisions:  # Only ARCHITECT and TL_* agents record decisions
+                self._write_json(agent_dir / "decisions.json", decisions)
+
+            self._output_cache[agent_name] = output
+            self._artifacts_cache[agent_name] = files
+            if decisions:
+                self._decisions_cache[agent_name] = copy.deepcopy(decisions)
+
+            if agent_name in manifest.get("in_progress", []):
+                manifest["in_progress"].remove(agent_name)
+            completed = manifest.setdefault("completed", [])
+            if agent_name not in completed:
+                completed.append(agent_name)
+            task_entry.update(
+                {
+                    "status": "completed",
+                    "completed_at": now,
+                    "tokens_used": tokens_used,
+                    "artifact_count": len(artifacts),
+                }
+            )
         logger.debug(f"Completed task for {agent_name}: {len(artifacts)} artifacts")
 
     def fail_task(self, agent_type: AgentType, error: str) -> None:
         """Mark a task as failed."""
         agent_name = agent_type.value
-        manifest = self.get_manifest()
-
-        if agent_name in manifest.get("in_progress", []):
-            manifest["in_progress"].remove(agent_name)
-
-        manifest["tasks"][agent_name].update(
-            {
-                "status": "failed",
-                "failed_at": datetime.utcnow().isoformat() + "Z",
-                "error": error,
-            }
-        )
-
-        self._write_manifest(manifest)
+        with self._update_manifest() as manifest:
+            if agent_name in manifest.get("in_progress", []):
+                manifest["in_progress"].remove(agent_name)
+
+            manifest["tasks"][agent_name].update(
+                {
+                    "status": "failed",
+                    "failed_at": utc_timestamp(),
+                    "error": error,
+                }
+            )
         logger.debug(f"Failed task for {agent_name}: {error}")
 
     def get_task_output(self, agent_type: AgentType) -> Optional[Dict[str, Any]]:
         """Get output from a completed task."""
+        cached = self._output_cache.get(agent_type.value)
+        if cached is not None:
+            return copy.deepcopy(cached)  # Holds lists; a shallow copy would share them
         agent_dir = self.tasks_dir / agent_type.value
         output_path = agent_dir / "output.json"
         if output_path.exists():
-            return self._read_json_with_lock(output_path)
+            return self._read_json(output_path)
         return None
 
     def get_task_artifacts(self, agent_type: AgentType) -> List[str]:
         """Get artifacts from a completed task."""
+        cached = self._artifacts_cache.get(agent_type.value)
+        if cached is not None:
+            return list(cached)
         agent_dir = self.tasks_dir / agent_type.value
         artifacts_path = agent_dir / "artifacts.json"
         if artifacts_path.exists():
-            data = self._read_json_with_lock(artifacts_path)
+            data = self._read_json(artifacts_path)
             return data.get("files", [])
         return []
 
     def get_task_decisions(self, agent_type: AgentType) -> Optional[Dict[str, Any]]:
         """Get architectural decisions from a task (for ARCHITECT, TL_* agents)."""
+        cached = self._decisions_cache.get(agent_type.value)
+        if cached is not None:
+            return copy.deepcopy(cached)
         agent_dir = self.tasks_dir / agent_type.value
         decisions_path = agent_dir / "decisions.json"
         if decisions_path.exists():
-            return self._read_json_with_lock(decisions_path)
+            return self._read_json(decisions_path)
         return None
 
     def is_task_completed(self, agent_type: AgentType) -> bool:
         """Check if a task is completed."""
-        manifest = self.get_manifest()
+        manifest = self._load_manifest()
         return agent_type.value in manifest.get("completed", [])
 
     def get_completed_agents(self) -> List[AgentType]:
         """Get list of completed agent types."""
-        manifest = self.get_manifest()
+        manifest = self._load_manifest()
         completed = manifest.get("completed", [])
         result = []
         for name in completed:
@@ -230,12 +315,14 @@ class TaskFileStore:
         dependencies: List[AgentType],
     ) -> Dict[str, Dict[str, Any]]:
         """Get context from all dependencies for an agent."""
-        context = {}
-        for dep in dependencies:
-            output = self.get_task_output(dep)
-            artifacts = self.get_task_artifacts(dep)
-            decisions = self.get_task_decisions(dep)
+        if len(dependencies) < self.PARALLEL_READ_MIN_DEPS:
+            results = [self._read_dependency(dep) for dep in dependencies]
+        else:
+            # File reads release the GIL, so per-dependency reads overlap in the pool
+            results = list(self._IO_POOL.map(self._read_dependency, dependencies))
 
+        context = {}
+        for dep, (output, artifacts, decisions) in zip(dependencies, results):
             if output or artifacts or decisions:
                 context[dep.value] = {
                     "output": output,
@@ -245,24 +332,33 @@ class TaskFileStore:
 
         return context
 
-    def _read_json_with_lock(self, path: Path) -> Dict[str, Any]:
-        """Read JSON file with shared lock for concurrent access."""
-        with open(path, "r") as f:
-            fcntl.flock(f.fileno(), fcntl.LOCK_SH)
-            try:
-                return json.load(f)
-            finally:
-                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    def _read_dependency(self, dep: AgentType) -> tuple:
+        """Read output, artifacts and decisions for one dependency."""
+        return self.get_task_output(dep), self.get_task_artifacts(dep), self.get_task_decisions(dep)
 
-    def _write_json_with_lock(self, path: Path, data: Dict[str, Any]) -> None:
-        """Write JSON file with exclusive lock for atomic updates."""
+    def _read_json(self, path: Path) -> Dict[str, Any]:
+        """Read a JSON file (writers replace files atomically, so no lock is needed)."""
+        with open(path, "rb") as f:
+            return loads_json(f.read())
+
+    def _write_json(self, path: Path, data: Dict[str, Any]) -> None:
+        """
+        Write a JSON file atomically.
+
+        The payload is encoded in memory, written to a unique temp file in the same
+        directory and moved into place with os.replace(), so readers only ever see
+        a complete file and no lock is held while encoding or writing.
+        """
+        payload = dumps_json(data)
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w") as f:
-            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-            try:
-                json.dump(data, f, indent=2)
-            finally:
-                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        tmp_path = path.with_name(f"{path.name}.{os.urandom(4).hex()}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
     def cleanup(self) -> None:
         """Remove task store (for testing or cleanup)."""
@@ -271,3 +367,7 @@ class TaskFileStore:
         if self.tasks_dir.exists():
             shutil.rmtree(self.tasks_dir)
             logger.debug("Cleaned up task store")
+        self._manifest_cache = self._manifest_stamp = None
+        self._output_cache.clear()
+        self._artifacts_cache.clear()
+        self._decisions_cache.clear()
@@ -1,14 +1,41 @@
-import json
+import itertools
+import sqlite3
+from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Sequence
 
 from agentic_builder.common.types import AgentType, Task
 from agentic_builder.common.utils import get_project_root
 
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (id TEXT PRIMARY KEY, data TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS deps (task_id TEXT NOT NULL, dep_id TEXT NOT NULL, PRIMARY KEY (task_id, dep_id));
+CREATE INDEX IF NOT EXISTS deps_dep_id ON deps (dep_id);
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class TaskSpec:
+    """What to create for one task; TaskManager assigns the id."""
+
+    description: str
+    agent_type: AgentType
+    dependencies: List[str] = field(default_factory=list)
+
 
 class TaskManager:
+    """Persists PMS tasks in a single SQLite database under ``.tasks/tasks.db``.
+
+    The connection is opened on first use. Task JSON files written by older
+    versions (``.tasks/TASK-*.json``) are imported when the database is created.
+    """
+
+    DB_NAME = "tasks.db"
+
     def __init__(self, output_dir: Optional[Path] = None):
         self._cache: Dict[str, Task] = {}
+        self._conn: Optional[sqlite3.Connection] = None
         # Use provided output_dir or fall back to get_project_root()
         self._output_dir = output_dir.resolve() if output_dir else get_project_root()
 
@@ -21,58 +48,123 @@ class TaskManager:
     def task_dir(self) -> Path:
         return self._output_dir / ".tasks"
 
-    def _get_path(self, task_id: str) -> Path:
-        return self.task_dir / f"{task_id}.json"
+    @property
+    def db_path(self) -> Path:
+        return self.task_dir / self.DB_NAME
 
-    def create_task(self, description: str, agent_type: AgentType, dependencies: List[str] = None) -> Task:
-        if not self.task_dir.exists():
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
             self.task_dir.mkdir(parents=True, exist_ok=True)
+            is_new = not self.db_path.exists()
+            conn = sqlite3.connect(self.db_path)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            if is_new:
+                self._import_legacy_files(conn)
+            self._conn = conn
+        return self._conn
+
+    def _import_legacy_files(self, conn: sqlite3.Connection):
+        """Load per-task JSON files left by the file-based store into a new database."""
+        tasks = []
+        for path in self.task_dir.glob("TASK-*.json"):
+            try:
+                tasks.append(Task.model_validate_json(path.read_bytes()))
+            except ValueError:
+                pass  # Not a task file
+        if tasks:
+            with conn:
+                self._write(conn, tasks)
+
+    def clear(self):
+        """Delete every task, e.g. to reuse one manager across independent runs."""
+        conn = self._db()
+        with conn:
+            conn.execute("DELETE FROM tasks")
+            conn.execute("DELETE FROM deps")
+        self._cache.clear()
+        self._id_seq = itertools.count(1)
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
 
-        # Determine ID based on existing count (simplified) usually we scan dir
-        # For concurrency safety usually we use random or a lock.
-        # Requirement says TASK-0001. I'll use a simple counter based on file count for now...
-        # ...or random to avoid race in this basic impl.
-        # Actually random hex is safer for MVP, but req said TASK-0001.
-        # I'll stick to random suffix for safety unless strict seq is needed.
-        # Let's try to do sequential if possible, scanning dir.
-        existing = list(self.task_dir.glob("TASK-*.json"))
-        next_num = len(existing) + 1
-        task_id = f"TASK-{next_num:04d}"
-
-        task = Task(id=task_id, description=description, agent_type=agent_type, dependencies=dependencies or [])
-        self.save_task(task)
-        return task
+    def create_task(self, description: str, agent_type: AgentType, dependencies: List[str] = None) -> Task:
+        return self.create_tasks([TaskSpec(description, agent_type, dependencies or [])])[0]
+
+    def create_tasks(self, specs: Sequence[TaskSpec]) -> List[Task]:
+        """Create several tasks with consecutive ids, committed in one transaction."""
+        conn = self._db()
+        tasks = [
+            Task(
+                id=self._next_task_id(),
+                description=spec.description,
+                agent_type=spec.agent_type,
+                dependencies=list(spec.dependencies),
+            )
+            for spec in specs
+        ]
+        with conn:
+            self._write(conn, tasks)
+        for task in tasks:
+            self._cache[task.id] = task
+        return tasks
+
+    @cached_property
+    def _id_seq(self) -> Iterator[int]:
+        """TASK-<n> numbers continuing after the highest stored one; the database is queried once."""
+        query = "SELECT MAX(CAST(SUBSTR(id, 6) AS INTEGER)) FROM tasks WHERE id LIKE 'TASK-%'"
+        return itertools.count((self._db().execute(query).fetchone()[0] or 0) + 1)
+
+    def _next_task_id(self) -> str:
+        """Allocate the next sequential TASK-<n> id."""
+        return f"TASK-{next(self._id_seq):04d}"
+
+    @staticmethod
+    def _write(conn: sqlite3.Connection, tasks: Sequence[Task]):
+        """Upsert task rows and replace their dependency edges; the caller owns the transaction."""
+        conn.executemany(
+            "INSERT OR REPLACE INTO tasks (id, data) VALUES (?, ?)", [(t.id, t.model_dump_json()) for t in tasks]
+        )
+        conn.executemany("DELETE FROM deps WHERE task_id = ?", [(t.id,) for t in tasks])
+        conn.executemany(
+            "INSERT OR IGNORE INTO deps (task_id, dep_id) VALUES (?, ?)",
+            [(t.id, dep_id) for t in tasks for dep_id in t.dependencies],
+        )
 
     def save_task(self, task: Task):
-        if not self.task_dir.exists():
-            self.task_dir.mkdir(parents=True, exist_ok=True)
-
+        conn = self._db()
+        with conn:  # One transaction for the task row and its dependency edges
+            self._write(conn, (task,))
         self._cache[task.id] = task
-        with open(self._get_path(task.id), "w") as f:
-            f.write(task.model_dump_json(indent=2))
 
     def get_task(self, task_id: str) -> Optional[Task]:
         if task_id in self._cache:
             return self._cache[task_id]
 
-        path = self._get_path(task_id)
-        if not path.exists():
+        row = self._db().execute("SELECT data FROM tasks WHERE id = ?", (task_id,)).fetchone()
+        if row is None:
             return None
 
-        with open(path, "r") as f:
-            data = json.load(f)
-            task = Task(**data)
-            self._cache[task_id] = task
-            return task
+        # Parse and validate in one pass through pydantic-core
+        task = Task.model_validate_json(row[0])
+        self._cache[task_id] = task
+        return task
 
     def get_dependencies(self, task_id: str) -> List[Task]:
         task = self.get_task(task_id)
         if not task:
             return []
 
-        deps = []
-        for dep_id in task.dependencies:
-            dt = self.get_task(dep_id)
-            if dt:
-                deps.append(dt)
-        return deps
+        cache = self._cache
+        if any(dep_id not in cache for dep_id in task.dependencies):
+            # Load every uncached dependency in one indexed join instead of one query each
+            rows = self._db().execute(
+                "SELECT t.id, t.data FROM deps d JOIN tasks t ON t.id = d.dep_id WHERE d.task_id = ?", (task_id,)
+            )
+            for dep_id, data in rows:
+                if dep_id not in cache:
+                    cache[dep_id] = Task.model_validate_json(data)
+        return [cache[dep_id] for dep_id in task.dependencies if dep_id in cache]
@@ -0,0 +1,75 @@
+import ast
+import importlib
+import os
+import shutil
+import subprocess
+from collections import defaultdict
+from pathlib import Path
+
+import pytest
+
+TESTS_DIR = Path(__file__).parent
+
+# The heaviest import graphs the suite touches; the package itself imports these lazily
+_WARM_MODULES = (
+    "agentic_builder.main",
+    "agentic_builder.orchestration.workflow_engine",
+    "agentic_builder.orchestration.parallel_engine",
+    "agentic_builder.orchestration.adaptive_orchestrator",
+    "agentic_builder.orchestration.single_session",
+    "agentic_builder.pms.task_file_store",
+    "agentic_builder.agents.fast_configs",
+    "agentic_builder.integration.batched_git",
+)
+
+
+def _duplicate_definitions(tests_dir: Path):
+    """Return ``(name, locations)`` for top-level test classes/functions defined more than once.
+
+    A redefinition inside one module silently shadows the first copy, and the same
+    test class pasted into two modules is collected and run twice.
+    """
+    seen = defaultdict(list)
+    for path in sorted(tests_dir.glob("test_*.py")):
+        tree = ast.parse(path.read_text(), filename=str(path))
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef) and node.name.startswith("Test"):
+                seen[node.name].append(f"{path.name}:{node.lineno}")
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name.startswith("test_"):
+                # Same-named test functions in different modules are fine, only flag in-module clashes
+                seen[f"{path.name}::{node.name}"].append(f"{path.name}:{node.lineno}")
+    return [(name, locations) for name, locations in seen.items() if len(locations) > 1]
+
+
+def pytest_configure(config):
+    # Pay the import cost once, before collection, instead of inside whichever test touches it first
+    for module_name in _WARM_MODULES:
+        importlib.import_module(module_name)
+
+
+def pytest_sessionstart(session):
+    duplicates = _duplicate_definitions(TESTS_DIR)
+    if duplicates:
+        lines = [f"  {name}: {', '.join(locations)}" for name, locations in duplicates]
+        raise pytest.UsageError("Duplicate test definitions in tests/:\n" + "\n".join(lines))
+
+
+@pytest.fixture(scope="session")
+def git_template(tmp_path_factory):
+    """An initialised, configured git repository, created once per session."""
+    template = tmp_path_factory.mktemp("git_template")
+    # Output is never inspected; GIT_TEST_CAPTURE=1 lets it through to pytest's capture for debugging
+    output = None if os.environ.get("GIT_TEST_CAPTURE") == "1" else subprocess.DEVNULL
+    subprocess.run(["git", "init"], cwd=template, check=True, stdout=output, stderr=output)
+    # Append the identity ourselves rather than spawning git config for it
+    with open(template / ".git" / "config", "a") as config:
+        config.write("[user]\n\temail = test@test.com\n\tname = Test\n")
+    return template
+
+
+@pytest.fixture
+def git_repo(git_template, tmp_path):
+    """A private copy of ``git_template``; copying .git is far cheaper than re-running git."""
+    repo = tmp_path / "repo"
+    shutil.copytree(git_template, repo, symlinks=True)
+    return repo
@@ -1,4 +1,4 @@
-from agentic_builder.agents.configs import AGENT_CONFIGS, get_agent_config
+from agentic_builder.agents.configs import AGENT_CONFIGS, get_agent_config, get_agent_prompt
 from agentic_builder.agents.response_parser import ResponseParser
 from agentic_builder.common.types import AgentType, ModelTier
 
@@ -54,6 +54,17 @@ def test_response_parser_success():
     assert parsed.artifacts[0].content.strip() == 'print("hello")'
 
 
+def test_response_parser_path_artifacts():
+    raw = '<summary>Done</summary><artifact path="src/app.py" action="modified"/><artifact path="README.md"/>'
+
+    parsed = ResponseParser.parse(raw)
+    assert [(a.name, a.path, a.action) for a in parsed.artifacts] == [
+        ("app.py", "src/app.py", "modified"),
+        ("README.md", "README.md", "created"),
+    ]
+    assert all(a.type == "file" and a.content is None for a in parsed.artifacts)
+
+
 def test_response_parser_failure():
     # Parser should default to success=True unless specific failure marker or empty?
     # Or maybe we assume success if we parse correctly.
@@ -64,3 +75,22 @@ def test_response_parser_failure():
     parsed = ResponseParser.parse(raw)
     # Depending on implementation, might fallback to treating whole text as summary
     assert parsed.summary == "Just some text"
+    assert parsed.success
+    assert parsed.artifacts == [] and parsed.next_steps == [] and parsed.warnings == []
+
+
+def test_agent_prompt_cached_per_working_directory(tmp_path, monkeypatch):
+    agents_dir = tmp_path / "prompts" / "agents"
+    agents_dir.mkdir(parents=True)
+    prompt_file = agents_dir / "PM.xml"
+    prompt_file.write_text("<pm/>")
+    monkeypatch.chdir(tmp_path)
+
+    assert get_agent_prompt(AgentType.PM) == "<pm/>"
+    prompt_file.write_text("<changed/>")
+    assert get_agent_prompt(AgentType.PM) == "<pm/>"  # Read once, then cached
+
+    other = tmp_path / "other"
+    other.mkdir()
+    monkeypatch.chdir(other)
+    assert get_agent_prompt(AgentType.PM) == "You are PM."
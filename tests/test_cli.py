@@ -1,15 +1,34 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
 from typer.testing import CliRunner
 
-from agentic_builder.main import app
+from agentic_builder.main import app, cli
 
 runner = CliRunner()
 
 
+@pytest.fixture(autouse=True)
+def isolated_cwd(tmp_path, monkeypatch):
+    """Run each command against an empty project instead of the checkout's sessions.
+
+    Commands resolve the project root from the cwd; monkeypatch restores it after the test.
+    """
+    monkeypatch.chdir(tmp_path)
+
+
 def test_app_version():
     result = runner.invoke(app, ["--version"])
-    # We haven't implemented --version yet, so checking mostly for not crashing or specific error if desired
-    # For now, let's just ensure we can invoke the app
-    assert result.exit_code != 0  # Should fail if option not defined, or pass if we define it
+    assert result.exit_code == 0
+    assert result.stdout.startswith("agentic-builder ")
+
+
+def test_cli_version_fast_path(capsys, monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["agentic-builder", "-V"])
+    cli()
+    assert capsys.readouterr().out.startswith("agentic-builder ")
 
 
 def test_list_command():
@@ -42,3 +61,15 @@ def test_run_command_help():
     result = runner.invoke(app, ["run", "--help"])
     assert result.exit_code == 0
     assert "workflow" in result.stdout
+
+
+def test_cli_import_defers_orchestration():
+    # Run in a fresh interpreter: this test session has already imported everything
+    code = (
+        "import sys, agentic_builder.main; "
+        "prefixes = ('agentic_builder.orchestration', 'agentic_builder.integration'); "
+        "print(any(m.startswith(prefixes) for m in sys.modules))"
+    )
+    repo_root = Path(__file__).resolve().parent.parent
+    result = subprocess.run([sys.executable, "-c", code], cwd=repo_root, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
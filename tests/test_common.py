@@ -1,4 +1,8 @@
+import os
+from datetime import datetime
+
 from agentic_builder.common.events import EventEmitter
+from agentic_builder.common.utils import resolve_within, utc_timestamp
 
 
 def test_event_emitter_basic():
@@ -48,3 +52,122 @@ def test_event_emitter_off():
     emitter.emit("evt", {})
 
     assert calls == 1
+
+
+def test_utc_timestamp_format():
+    stamp = utc_timestamp()
+
+    assert stamp.endswith("Z")
+    # Round-trips through the ISO parser once the "Z" is expanded
+    assert datetime.fromisoformat(stamp[:-1] + "+00:00").utcoffset().total_seconds() == 0
+
+
+def test_event_emitter_emit_batch():
+    emitter = EventEmitter()
+    batches = []
+
+    emitter.on("phase_completed", batches.append)
+    emitter.emit_batch("phase_completed", [{"agent": "PM"}, {"agent": "ARCHITECT"}])
+    emitter.emit_batch("phase_completed", [])
+
+    assert batches == [[{"agent": "PM"}, {"agent": "ARCHITECT"}]]
+
+
+def test_event_emitter_off_restores_empty_state():
+    emitter = EventEmitter()
+    calls = []
+
+    emitter.emit("evt", {})  # No listeners registered yet
+    emitter.on("evt", calls.append)
+    emitter.on("evt", print)
+    emitter.off("evt", print)
+    emitter.emit("evt", 1)
+    emitter.off("evt", calls.append)
+    emitter.off("evt", calls.append)  # Already removed
+    emitter.emit("evt", 2)
+
+    assert calls == [1]
+    assert emitter._listeners is None
+
+
+def test_event_emitter_off_during_emit():
+    emitter = EventEmitter()
+    calls = []
+
+    def once(payload):
+        calls.append(("once", payload))
+        emitter.off("evt", once)
+
+    emitter.on("evt", once)
+    emitter.on("evt", lambda payload: calls.append(("always", payload)))
+    emitter.emit("evt", 1)
+    emitter.emit("evt", 2)
+
+    # Removing a listener mid-dispatch does not skip the ones after it
+    assert calls == [("once", 1), ("always", 1), ("always", 2)]
+
+
+def test_resolve_within(tmp_path):
+    root = tmp_path / "proj"
+    (root / "src").mkdir(parents=True)
+    (tmp_path / "proj-evil").mkdir()
+    (root / "link").symlink_to(tmp_path)
+    base = str(root.resolve())
+
+    assert resolve_within(base, "src/app.py") == os.path.join(base, "src", "app.py")
+    assert resolve_within(base, str(root / "src")) == os.path.join(base, "src")
+    assert resolve_within(base, "../escaped_file.txt") is None
+    assert resolve_within(base, "../proj-evil/x") is None  # Shares the "proj" prefix only
+    assert resolve_within(base, "link/outside.txt") is None  # Symlink out of the project
+
+
+def test_event_emitter_batched_off():
+    emitter = EventEmitter()
+    calls = []
+    listeners = [lambda payload, i=i: calls.append(i) for i in range(5)]
+    for listener in listeners:
+        emitter.on("evt", listener)
+    emitter.on("evt", listeners[0])  # Registered twice
+
+    for listener in listeners[:4]:
+        emitter.off("evt", listener)
+    emitter.emit("evt", None)
+    assert calls == [4, 0]  # One registration of listeners[0] remains
+
+    emitter.off("evt", listeners[4])
+    emitter.off("evt", listeners[0])
+    emitter.emit("evt", None)
+    assert calls == [4, 0]
+    assert emitter._listeners is None and emitter._removed is None
+
+
+def test_event_emitter_off_several_during_emit():
+    emitter = EventEmitter()
+    calls = []
+
+    def a(payload):
+        calls.append("a")
+
+    def b(payload):
+        calls.append("b")
+
+    def c(payload):
+        calls.append("c")
+
+    def remover(payload):
+        calls.append("remover")
+        emitter.off("evt", a)
+        emitter.off("evt", a)  # Drops both registrations of a, first to last
+        emitter.off("evt", c)
+        emitter.off("evt", remover)
+
+    for listener in (a, remover, b, a, c, a, b):
+        emitter.on("evt", listener)
+    emitter.emit("evt", None)
+    # The dispatch already under way still reaches every listener
+    assert calls == ["a", "remover", "b", "a", "c", "a", "b"]
+
+    calls.clear()
+    emitter.emit("evt", None)
+    assert calls == ["b", "a", "b"]  # The last registration of a survives
+    assert emitter._removed is None
@@ -13,30 +13,17 @@ from agentic_builder.pms.task_manager import TaskManager
 
 
 @pytest.fixture
-def mock_env_e2e(tmp_path):
-    # Patch all persistence paths to temp dir
-    # Since both managers use get_project_root, we can mock that in one place if we patch where they import it
-    # But they import it individually.
-    # Actually, patch 'agentic_builder.common.utils.get_project_root' might not work
-    # if they imported it using `from ... import get_project_root`.
-    # Let's check imports.
-    # They do `from agentic_builder.common.utils import get_project_root`.
-    # So we need to patch it in their respective modules.
-
-    with (
-        patch("agentic_builder.orchestration.session_manager.get_project_root", return_value=tmp_path),
-        patch("agentic_builder.pms.task_manager.get_project_root", return_value=tmp_path),
-        patch.dict(os.environ, {"AMAB_MOCK_GH_CLI": "1", "AMAB_MOCK_CLAUDE_CLI": "1"}),
-    ):
+def mock_env_e2e():
+    with patch.dict(os.environ, {"AMAB_MOCK_GH_CLI": "1", "AMAB_MOCK_CLAUDE_CLI": "1"}):
         yield
 
 
-def test_full_workflow_execution(mock_env_e2e):
-    # Setup Managers
-    session_mgr = SessionManager()
-    pms = TaskManager()
-    git = GitManager()
-    claude = ClaudeClient()
+def test_full_workflow_execution(mock_env_e2e, tmp_path):
+    # Setup Managers, all persisting under the temp dir
+    session_mgr = SessionManager(output_dir=tmp_path)
+    pms = TaskManager(output_dir=tmp_path)
+    git = GitManager(output_dir=tmp_path)
+    claude = ClaudeClient(output_dir=tmp_path)
     pr_mgr = PRManager()
 
     # We need to mock git methods that use subprocess even in mock mode if they verify git repo existence
@@ -62,9 +49,9 @@ def test_full_workflow_execution(mock_env_e2e):
         # Since cache might be empty if we reloaded, check filesystem via manager logic?
         # Actually pms.create_task populates cache.
         # FULL_APP_GENERATION includes all agent types
-        from agentic_builder.common.types import AgentType
+        from agentic_builder.common.types import ALL_AGENT_TYPES
 
-        assert len(session.completed_tasks) == len(list(AgentType))
+        assert len(session.completed_tasks) == len(ALL_AGENT_TYPES)
 
         # Verify PR creation
         # We can check if pr_mgr.create_pr was called if we mocked it, but we are using "Real" pr_mgr with Mock Env.
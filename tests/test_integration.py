@@ -1,4 +1,6 @@
 import os
+import subprocess
+import sys
 from unittest.mock import ANY, patch
 
 import pytest
@@ -26,6 +28,41 @@ def test_git_manager_create_branch():
         )
 
 
+def test_git_manager_commit_files_batched(tmp_path):
+    gm = GitManager(output_dir=tmp_path)
+    with patch("subprocess.run") as mock_run:
+        gm.commit_files(["a b.txt", "c.txt"], "Add files")
+        # add + commit go through one shell; arguments stay quoted
+        mock_run.assert_called_once_with(
+            ["sh", "-c", "git add 'a b.txt' c.txt && git commit -m 'Add files'"],
+            check=True,
+            capture_output=True,
+            text=True,
+            cwd=tmp_path.resolve(),
+        )
+
+
+@pytest.mark.integration
+def test_git_manager_commit_and_push(git_repo, tmp_path):
+    origin = tmp_path / "origin.git"
+    subprocess.run(["git", "init", "--bare", "-q", str(origin)], check=True)
+    subprocess.run(["git", "remote", "add", "origin", str(origin)], cwd=git_repo, check=True)
+    (git_repo / "app.py").write_text("print('app')\n")
+
+    gm = GitManager(output_dir=git_repo)
+    gm.create_branch("feature/app")
+    gm.commit_and_push("feature/app", "Add app", ["app.py"])
+
+    assert gm._run(["git", "rev-parse", "--abbrev-ref", "HEAD"], capture_output=True).strip() == "feature/app"
+    assert gm._run(["git", "log", "--format=%s"], capture_output=True).strip() == "Add app"
+    # Pushed with -u: the remote has the commit and the branch tracks it
+    remote_log = subprocess.run(
+        ["git", "log", "--format=%s", "feature/app"], cwd=origin, check=True, capture_output=True, text=True
+    )
+    assert remote_log.stdout.strip() == "Add app"
+    assert gm._run(["git", "rev-parse", "--abbrev-ref", "@{u}"], capture_output=True).strip() == "origin/feature/app"
+
+
 def test_pr_manager_create(mock_env):
     pm = PRManager()
     # Should not call subprocess if mocked
@@ -42,16 +79,21 @@ def test_claude_client_mock(mock_env):
 
     assert response.success
     assert "Mock response" in response.summary or "Mock" in response.summary
+    # Each call gets its own copy of the cached response
+    response.next_steps.append("Mutated")
+    response.metadata["tokensUsed"] = 0
+    again = client.call_agent(AgentType.PM, "Exec task", "Build app", ModelTier.OPUS)
+    assert again is not response
+    assert again.next_steps == ["Review output", "Proceed to next stage"]
+    assert again.metadata == {"tokensUsed": 150}
 
 
-def test_claude_client_real_attempt():
+def test_claude_client_real_attempt(tmp_path):
     # If we unset the mock env, it should try to execute claude (and fail in sandbox or we mock subprocess)
     with patch.dict(os.environ, {"AMAB_MOCK_CLAUDE_CLI": ""}):
-        client = ClaudeClient()
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value.stdout = "<summary>Real output</summary>"
-            mock_run.return_value.returncode = 0
-
+        # Keep the project-local .claude/ config inside this test's tmp_path
+        client = ClaudeClient(output_dir=tmp_path)
+        with patch.object(ClaudeClient, "_run_cli", return_value=("<summary>Real output</summary>", "")) as mock_run:
             # We must also mock get_agent_prompt since it tries to read files
             with patch("agentic_builder.integration.claude_client.get_agent_prompt") as mock_prompt:
                 mock_prompt.return_value = "System Prompt"
@@ -59,8 +101,40 @@ def test_claude_client_real_attempt():
                 resp = client.call_agent(AgentType.PM, "Exec task", "in", ModelTier.OPUS)
                 assert resp.summary == "Real output"
                 # Verify command structure
-                args = mock_run.call_args[0][0]
+                args, kwargs = mock_run.call_args
+                cmd = args[0]
                 # Check for flags we implemented: --model, --system-prompt, -p, -
-                assert "--system-prompt" in args
-                assert "-p" in args
-                assert "System Prompt" in args
+                assert cmd[0] == "claude"
+                assert cmd[cmd.index("--model") + 1] == ModelTier.OPUS.value
+                assert cmd[cmd.index("--system-prompt") + 1] == "System Prompt"
+                assert cmd[cmd.index("-p") + 1] == "Exec task"
+                # Context goes to stdin ("-"), not argv, to stay clear of ARG_MAX
+                assert cmd[-1] == "-"
+                assert args[1] == "in"
+                assert "in" not in cmd
+
+                # Config dir and environment are prepared once per client
+                env = kwargs["env"]
+                assert env["CLAUDE_CONFIG_DIR"] == str(client.output_dir / ".claude")
+                client.call_agent(AgentType.PM, "Exec task", "in", ModelTier.OPUS)
+                assert mock_run.call_args.kwargs["env"] is env
+
+
+def test_claude_client_run_cli_streams_stdin_and_stdout(tmp_path):
+    echo = [sys.executable, "-c", "import sys; data = sys.stdin.read(); print(len(data)); print(data[:3])"]
+    big_input = "x" * 1_000_000  # Larger than a pipe buffer
+
+    stdout, stderr = ClaudeClient._run_cli(echo, big_input, cwd=tmp_path, env=dict(os.environ))
+
+    assert stdout.splitlines() == ["1000000", "xxx"]
+    assert stderr == ""
+
+
+def test_claude_client_run_cli_raises_on_failure(tmp_path):
+    fail = [sys.executable, "-c", "import sys; sys.stderr.write('boom'); sys.exit(3)"]
+
+    with pytest.raises(subprocess.CalledProcessError) as excinfo:
+        ClaudeClient._run_cli(fail, "", cwd=tmp_path, env=dict(os.environ))
+
+    assert excinfo.value.returncode == 3
+    assert excinfo.value.stderr == "boom"
@@ -33,6 +33,24 @@ def test_session_update_status(session_manager):
     assert loaded.status == WorkflowStatus.RUNNING
 
 
+def test_session_load_refresh(session_manager):
+    session = session_manager.create_session("test-flow")
+    # Another process updates the session file on disk
+    other = SessionManager(output_dir=session_manager.output_dir)
+    other.update_status(session.id, WorkflowStatus.COMPLETED)
+
+    assert session_manager.load_session(session.id) is session  # Served from cache
+    assert session_manager.load_session(session.id, refresh=True).status == WorkflowStatus.COMPLETED
+
+
+def test_session_load_refresh_drops_deleted_session(session_manager):
+    session = session_manager.create_session("test-flow")
+    session_manager._get_path(session.id).unlink()
+
+    assert session_manager.load_session(session.id, refresh=True) is None
+    assert session_manager.load_session(session.id) is None  # No stale cache entry
+
+
 def test_workflow_engine_start(session_manager):
     # Mock dependencies
     mock_pms = MagicMock()
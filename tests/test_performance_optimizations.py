@@ -1,91 +1,220 @@
 """Tests for the new performance optimization modules."""
 
-import tempfile
+import itertools
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-
-from agentic_builder.common.types import AgentType
+from unittest.mock import patch
+
+import pytest
+
+from agentic_builder.agents.fast_configs import (
+    AGENT_VALUE,
+    FAST_AGENT_CONFIGS_MAP,
+    SUBAGENT_NAME,
+    TIER_DISTRIBUTION,
+    get_tier_distribution,
+)
+from agentic_builder.common import utils
+from agentic_builder.common.types import AgentType, ModelTier, OrchestratorType, ScopeLevel, WorkflowConstraints
+from agentic_builder.integration.batched_git import BatchedGitManager, PhaseCommitStrategy
+from agentic_builder.main import get_orchestrator
+from agentic_builder.orchestration.adaptive_orchestrator import (
+    AdaptiveOrchestrator,
+    ConfidenceLevel,
+    SkipDecision,
+    SpawnRequest,
+)
+from agentic_builder.orchestration.parallel_engine import ParallelWorkflowEngine
+from agentic_builder.orchestration.single_session import SingleSessionOrchestrator
+from agentic_builder.orchestration.workflow_engine import WorkflowEngine
+from agentic_builder.pms.minimal_context import MinimalContextSerializer
+from agentic_builder.pms.task_file_store import TaskFileStore
 
 
 class TestTaskFileStore:
     """Tests for the TaskFileStore class."""
 
-    def test_initialize_session(self):
-        """Test session initialization creates manifest."""
-        from agentic_builder.pms.task_file_store import TaskFileStore
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            store = TaskFileStore(Path(tmpdir))
-            store.initialize_session(
-                session_id="test123",
-                workflow="FULL_APP_GENERATION",
-                project_idea="Build a todo app",
-                agents=[AgentType.PM, AgentType.ARCHITECT],
-            )
-
-            manifest = store.get_manifest()
-            assert manifest["session_id"] == "test123"
-            assert manifest["workflow"] == "FULL_APP_GENERATION"
-            assert manifest["project_idea"] == "Build a todo app"
-            assert "PM" in manifest["pending"]
-            assert "ARCHITECT" in manifest["pending"]
-
-    def test_start_and_complete_task(self):
-        """Test task lifecycle: start and complete."""
-        from agentic_builder.pms.task_file_store import TaskFileStore
+    def test_task_file_store_lifecycle(self, tmp_path):
+        """Test initialize -> start -> complete -> read back on one session."""
+        store = TaskFileStore(tmp_path)
+        store.initialize_session(
+            session_id="test123",
+            workflow="FULL_APP_GENERATION",
+            project_idea="Build a todo app",
+            agents=[AgentType.PM, AgentType.ARCHITECT],
+        )
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            store = TaskFileStore(Path(tmpdir))
-            store.initialize_session(
-                session_id="test123",
-                workflow="TEST",
-                project_idea="Test",
-                agents=[AgentType.PM],
-            )
+        manifest = store.get_manifest()
+        assert manifest["session_id"] == "test123"
+        assert manifest["workflow"] == "FULL_APP_GENERATION"
+        assert manifest["project_idea"] == "Build a todo app"
+        assert "PM" in manifest["pending"]
+        assert "ARCHITECT" in manifest["pending"]
 
-            store.start_task(AgentType.PM)
-            manifest = store.get_manifest()
-            assert "PM" in manifest["in_progress"]
-            assert "PM" not in manifest["pending"]
-
-            store.complete_task(
-                agent_type=AgentType.PM,
-                summary="Completed PM analysis",
-                artifacts=["docs/requirements.md"],
-                next_steps=["Run architect"],
-                warnings=[],
-                tokens_used=1000,
-            )
+        store.start_task(AgentType.PM)
+        manifest = store.get_manifest()
+        assert "PM" in manifest["in_progress"]
+        assert "PM" not in manifest["pending"]
 
-            manifest = store.get_manifest()
-            assert "PM" in manifest["completed"]
-            assert "PM" not in manifest["in_progress"]
+        store.complete_task(
+            agent_type=AgentType.PM,
+            summary="Completed PM analysis",
+            artifacts=["file1.py", "file2.py"],
+            next_steps=["Run architect"],
+            warnings=[],
+            tokens_used=1000,
+        )
 
-    def test_get_task_output(self):
-        """Test retrieving task output."""
-        from agentic_builder.pms.task_file_store import TaskFileStore
+        manifest = store.get_manifest()
+        assert "PM" in manifest["completed"]
+        assert "PM" not in manifest["in_progress"]
+        assert "ARCHITECT" in manifest["pending"]
+
+        output = store.get_task_output(AgentType.PM)
+        assert output["summary"] == "Completed PM analysis"
+        assert manifest["tasks"]["PM"]["completed_at"] == output["completed_at"]
+
+        artifacts = store.get_task_artifacts(AgentType.PM)
+        assert len(artifacts) == 2
+        assert "file1.py" in artifacts
+
+    def test_manifest_cache_sees_external_writes(self, tmp_path):
+        """Test the cached manifest is refreshed when another writer changes it."""
+        store = TaskFileStore(tmp_path)
+        store.initialize_session(
+            session_id="test123",
+            workflow="TEST",
+            project_idea="Test",
+            agents=[AgentType.PM],
+        )
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            store = TaskFileStore(Path(tmpdir))
+        # Callers get a copy, not the cache itself
+        store.get_manifest()["pending"].clear()
+        assert store.get_manifest()["pending"] == ["PM"]
+
+        # Another process rewrites the manifest
+        other = TaskFileStore(tmp_path)
+        other.start_task(AgentType.PM)
+        manifest_path = tmp_path / ".tasks" / "manifest.json"
+        assert json.loads(manifest_path.read_text())["in_progress"] == ["PM"]
+
+        assert store.get_manifest()["in_progress"] == ["PM"]
+
+    def test_failed_manifest_update_leaves_cache_untouched(self, tmp_path):
+        """Test an update that raises part-way does not leave unwritten changes in the cache."""
+        store = TaskFileStore(tmp_path)
+        store.initialize_session(session_id="s", workflow="TEST", project_idea="Test", agents=[AgentType.PM])
+
+        # PM was never started, so it has no task entry to complete
+        with pytest.raises(KeyError):
+            store.complete_task(agent_type=AgentType.PM, summary="Done", artifacts=[])
+
+        assert not store.is_task_completed(AgentType.PM)
+        assert store.get_manifest()["completed"] == []
+        # The check runs before anything is written
+        assert store.get_task_output(AgentType.PM) is None
+        assert not (tmp_path / ".tasks" / "PM").exists()
+
+    def test_completed_outputs_served_from_memory(self, tmp_path):
+        """Test outputs written by a store are served without re-reading disk."""
+        store = TaskFileStore(tmp_path)
+        store.initialize_session(
+            session_id="test123",
+            workflow="TEST",
+            project_idea="Test",
+            agents=[AgentType.ARCHITECT],
+        )
+        store.start_task(AgentType.ARCHITECT)
+        store.complete_task(
+            agent_type=AgentType.ARCHITECT,
+            summary="Designed",
+            artifacts=["docs/arch.md"],
+            decisions={"db": "sqlite"},
+        )
+        (tmp_path / ".tasks" / "ARCHITECT" / "output.json").unlink()
+
+        assert store.get_task_output(AgentType.ARCHITECT)["summary"] == "Designed"
+        assert store.get_task_artifacts(AgentType.ARCHITECT) == ["docs/arch.md"]
+        assert store.get_task_decisions(AgentType.ARCHITECT) == {"db": "sqlite"}
+
+        # Other instances still read from disk, and cleanup drops the cache
+        assert TaskFileStore(tmp_path).get_task_output(AgentType.ARCHITECT) is None
+        store.cleanup()
+        assert store.get_task_artifacts(AgentType.ARCHITECT) == []
+
+    def test_cached_outputs_are_not_shared_with_callers(self, tmp_path):
+        """Test mutating a returned output or decision leaves the in-memory copy intact."""
+        store = TaskFileStore(tmp_path)
+        store.initialize_session(session_id="s", workflow="TEST", project_idea="Test", agents=[AgentType.ARCHITECT])
+        store.start_task(AgentType.ARCHITECT)
+        next_steps = ["Review"]
+        store.complete_task(
+            agent_type=AgentType.ARCHITECT,
+            summary="Designed",
+            artifacts=["docs/arch.md"],
+            next_steps=next_steps,
+            decisions={"services": ["api"]},
+        )
+        next_steps.append("From the caller")
+
+        store.get_task_output(AgentType.ARCHITECT)["next_steps"].append("Mutated")
+        store.get_task_decisions(AgentType.ARCHITECT)["services"].append("worker")
+
+        assert store.get_task_output(AgentType.ARCHITECT)["next_steps"] == ["Review"]
+        assert store.get_task_decisions(AgentType.ARCHITECT) == {"services": ["api"]}
+
+    def test_get_dependency_context(self, tmp_path):
+        """Test dependency context is identical on the serial and pooled read paths."""
+        deps = [AgentType.PM, AgentType.ARCHITECT, AgentType.UIUX_GUI, AgentType.TEST]
+        writer = TaskFileStore(tmp_path)
+        writer.initialize_session(session_id="s", workflow="TEST", project_idea="Test", agents=deps)
+        for dep in deps[:3]:
+            writer.start_task(dep)
+            writer.complete_task(agent_type=dep, summary=f"{dep.value} done", artifacts=[f"{dep.value}.md"])
+
+        # A fresh store has no in-memory outputs and reads from disk
+        reader = TaskFileStore(tmp_path)
+        pooled = reader.get_dependency_context(AgentType.DEV_UI_WEB, deps)
+        serial = reader.get_dependency_context(AgentType.DEV_UI_WEB, deps[:2])
+
+        assert list(pooled) == ["PM", "ARCHITECT", "UIUX_GUI"]  # TEST has no output
+        assert pooled["ARCHITECT"]["output"]["summary"] == "ARCHITECT done"
+        assert pooled["UIUX_GUI"]["artifacts"] == ["UIUX_GUI.md"]
+        assert serial == {k: pooled[k] for k in ("PM", "ARCHITECT")}
+
+    def test_parallel_safe_manifest_updates(self, tmp_path):
+        """Test concurrent writers with parallel_safe=True do not lose manifest updates."""
+        agents = [AgentType.PM, AgentType.ARCHITECT, AgentType.UIUX_GUI, AgentType.TEST, AgentType.CQR, AgentType.SR]
+        TaskFileStore(tmp_path).initialize_session(session_id="s", workflow="TEST", project_idea="Test", agents=agents)
+
+        # One store per worker, as if each were a separate process
+        def start(agent):
+            TaskFileStore(tmp_path, parallel_safe=True).start_task(agent)
+
+        with ThreadPoolExecutor(max_workers=len(agents)) as pool:
+            list(pool.map(start, agents))
+
+        manifest = TaskFileStore(tmp_path).get_manifest()
+        assert sorted(manifest["in_progress"]) == sorted(a.value for a in agents)
+        assert manifest["pending"] == []
+
+    def test_json_roundtrip_without_orjson(self, tmp_path):
+        """Test the stdlib json fallback produces the same data."""
+        with patch.object(utils, "orjson", None):
+            store = TaskFileStore(tmp_path)
             store.initialize_session(
                 session_id="test123",
                 workflow="TEST",
-                project_idea="Test",
+                project_idea="Café app",
                 agents=[AgentType.PM],
             )
-
             store.start_task(AgentType.PM)
-            store.complete_task(
-                agent_type=AgentType.PM,
-                summary="Test summary",
-                artifacts=["file1.py", "file2.py"],
-            )
-
-            output = store.get_task_output(AgentType.PM)
-            assert output["summary"] == "Test summary"
+            store.complete_task(agent_type=AgentType.PM, summary="Done", artifacts=["a.py"])
 
-            artifacts = store.get_task_artifacts(AgentType.PM)
-            assert len(artifacts) == 2
-            assert "file1.py" in artifacts
+            assert store.get_manifest()["project_idea"] == "Café app"
+            assert store.get_task_artifacts(AgentType.PM) == ["a.py"]
 
 
 class TestMinimalContextSerializer:
@@ -93,8 +222,6 @@ class TestMinimalContextSerializer:
 
     def test_serialize_pm(self):
         """Test serialization for PM (first agent with project idea)."""
-        from agentic_builder.pms.minimal_context import MinimalContextSerializer
-
         result = MinimalContextSerializer.serialize(
             agent_type=AgentType.PM,
             dependencies=[],
@@ -107,8 +234,6 @@ class TestMinimalContextSerializer:
 
     def test_serialize_dependent_agent(self):
         """Test serialization for agents with dependencies."""
-        from agentic_builder.pms.minimal_context import MinimalContextSerializer
-
         result = MinimalContextSerializer.serialize(
             agent_type=AgentType.ARCHITECT,
             dependencies=[AgentType.PM],
@@ -121,8 +246,6 @@ class TestMinimalContextSerializer:
 
     def test_get_recommended_reads(self):
         """Test recommended read files for different agents."""
-        from agentic_builder.pms.minimal_context import MinimalContextSerializer
-
         # ARCHITECT should read PM output
         reads = MinimalContextSerializer.get_recommended_reads(AgentType.ARCHITECT)
         assert ".tasks/PM/output.json" in reads
@@ -137,92 +260,97 @@ class TestFastConfigs:
 
     def test_fast_configs_exist(self):
         """Test that fast configs are defined for expected agents."""
-        from agentic_builder.agents.fast_configs import FAST_AGENT_CONFIGS_MAP
-
         assert AgentType.PM in FAST_AGENT_CONFIGS_MAP
         assert AgentType.ARCHITECT in FAST_AGENT_CONFIGS_MAP
         assert AgentType.DEV_UI_WEB in FAST_AGENT_CONFIGS_MAP
 
     def test_model_tier_distribution(self):
         """Test that model tiers are properly distributed for speed."""
-        from agentic_builder.agents.fast_configs import (
-            FAST_AGENT_CONFIGS_MAP,
-            get_tier_distribution,
-        )
-        from agentic_builder.common.types import ModelTier
-
         dist = get_tier_distribution()
 
         # Should have more Haiku than others for speed
         assert dist.get("haiku", 0) > dist.get("opus", 0)
         assert dist.get("haiku", 0) > dist.get("sonnet", 0)
 
+        # Callers get their own copy of the precomputed counts
+        assert dist == TIER_DISTRIBUTION
+        assert dist is not TIER_DISTRIBUTION
+
         # PM should be Opus (critical reasoning)
         assert FAST_AGENT_CONFIGS_MAP[AgentType.PM].model_tier == ModelTier.OPUS
 
         # DEV agents should be Haiku (fast implementation)
         assert FAST_AGENT_CONFIGS_MAP[AgentType.DEV_UI_WEB].model_tier == ModelTier.HAIKU
 
+    def test_subagent_names(self):
+        """Test precomputed subagent names match the .claude/agents file naming."""
+        assert SUBAGENT_NAME[AgentType.PM] == "main-pm"
+        assert SUBAGENT_NAME[AgentType.TL_UI_WEB] == "main-tl-ui-web"
+        assert AGENT_VALUE[AgentType.DEV_CORE_API] == "DEV_CORE_API"
+
 
 class TestBatchedGitManager:
     """Tests for BatchedGitManager."""
 
-    def test_stage_and_commit_phase(self):
+    def test_stage_and_commit_phase(self, tmp_path):
         """Test staging files and committing a phase."""
-        from agentic_builder.integration.batched_git import BatchedGitManager
+        git = BatchedGitManager(tmp_path)
+        git.start_phase("Planning")
+        git.stage_change("test.py", AgentType.PM, "Created requirements")
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create a git repo
-            import subprocess
+        assert len(git.current_phase.changes) == 1
+        assert git.current_phase.name == "Planning"
 
-            subprocess.run(["git", "init"], cwd=tmpdir, capture_output=True)
-            subprocess.run(
-                ["git", "config", "user.email", "test@test.com"],
-                cwd=tmpdir,
-                capture_output=True,
-            )
-            subprocess.run(
-                ["git", "config", "user.name", "Test"],
-                cwd=tmpdir,
-                capture_output=True,
-            )
+        with patch.object(BatchedGitManager, "_run_git") as mock_git:
+            assert git.commit_phase() is True
 
-            # Create a test file
-            test_file = Path(tmpdir) / "test.py"
-            test_file.write_text("# test")
+        assert mock_git.call_args_list[0].args == (["add", "test.py"],)
+        assert mock_git.call_args_list[1].args == (["commit", "-m", "[PM] Created requirements"],)
+        assert git.current_phase is None
+        assert git.get_stats()["phases"] == ["Planning"]
 
-            git = BatchedGitManager(Path(tmpdir))
-            git.start_phase("Planning")
-            git.stage_change(str(test_file), AgentType.PM, "Created requirements")
+    @pytest.mark.integration
+    def test_commit_phase_real_git(self, git_repo):
+        """Test a phase commit lands in a real repository."""
+        (git_repo / "test.py").write_text("# test")
 
-            assert len(git.current_phase.changes) == 1
-            assert git.current_phase.name == "Planning"
+        git = BatchedGitManager(git_repo)
+        git.start_phase("Planning")
+        git.stage_change("test.py", AgentType.PM, "Created requirements")
+
+        assert git.commit_phase() is True
+        assert git._run_git(["log", "--format=%s"]).strip() == "[PM] Created requirements"
 
     def test_phase_commit_strategy(self):
         """Test phase classification for agents."""
-        from agentic_builder.integration.batched_git import PhaseCommitStrategy
-
         assert PhaseCommitStrategy.get_phase_for_agent(AgentType.PM) == "PLANNING"
         assert PhaseCommitStrategy.get_phase_for_agent(AgentType.ARCHITECT) == "ARCHITECTURE"
         assert PhaseCommitStrategy.get_phase_for_agent(AgentType.DEV_UI_WEB) == "IMPLEMENTATION"
         assert PhaseCommitStrategy.get_phase_for_agent(AgentType.TEST) == "QUALITY"
 
 
+@pytest.fixture(scope="class")
+def orch_root(tmp_path_factory):
+    """Project root shared within a test class; only for tests that never write to it."""
+    return tmp_path_factory.mktemp("orch")
+
+
+@pytest.fixture
+def orch(tmp_path):
+    return AdaptiveOrchestrator(tmp_path, interactive=False)
+
+
 class TestAdaptiveOrchestrator:
     """Tests for AdaptiveOrchestrator."""
 
     def test_confidence_levels(self):
         """Test confidence level enum values."""
-        from agentic_builder.orchestration.adaptive_orchestrator import ConfidenceLevel
-
         assert ConfidenceLevel.HIGH == "high"
         assert ConfidenceLevel.MEDIUM == "medium"
         assert ConfidenceLevel.LOW == "low"
 
     def test_spawn_request_dataclass(self):
         """Test SpawnRequest dataclass."""
-        from agentic_builder.orchestration.adaptive_orchestrator import SpawnRequest
-
         req = SpawnRequest(
             agent="DEV_UI_WEB",
             reason="Implement frontend",
@@ -236,27 +364,19 @@ class TestAdaptiveOrchestrator:
 
     def test_skip_decision_dataclass(self):
         """Test SkipDecision dataclass."""
-        from agentic_builder.orchestration.adaptive_orchestrator import SkipDecision
-
         skip = SkipDecision(agent="DEV_UI_MOBILE", reason="Web only project")
         assert skip.agent == "DEV_UI_MOBILE"
         assert skip.reason == "Web only project"
 
-    def test_orchestrator_initialization(self):
+    def test_orchestrator_initialization(self, orch, tmp_path):
         """Test orchestrator initializes correctly."""
-        from agentic_builder.orchestration.adaptive_orchestrator import AdaptiveOrchestrator
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            orch = AdaptiveOrchestrator(Path(tmpdir), interactive=False)
-            assert orch.project_root == Path(tmpdir)
-            assert orch.interactive is False
-            assert len(orch.skipped_agents) == 0
-            assert len(orch.completed_agents) == 0
+        assert orch.project_root == tmp_path
+        assert orch.interactive is False
+        assert len(orch.skipped_agents) == 0
+        assert len(orch.completed_agents) == 0
 
     def test_orchestrator_agent_mapping(self):
         """Test agent name to subagent type mapping."""
-        from agentic_builder.orchestration.adaptive_orchestrator import AdaptiveOrchestrator
-
         mapping = AdaptiveOrchestrator.AGENT_MAPPING
         assert mapping["PM"] == "main-pm"
         assert mapping["architect-system"] == "architect-system"
@@ -266,33 +386,47 @@ class TestAdaptiveOrchestrator:
 class TestSingleSessionOrchestrator:
     """Tests for SingleSessionOrchestrator."""
 
-    def test_compute_phases(self):
+    def test_compute_phases(self, tmp_path):
         """Test phase computation from agent list."""
-        from agentic_builder.orchestration.single_session import SingleSessionOrchestrator
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            orch = SingleSessionOrchestrator(Path(tmpdir))
-            execution_order = [AgentType.PM, AgentType.ARCHITECT, AgentType.TL_UI_WEB]
-            phases = orch._compute_phases(execution_order)
+        orch = SingleSessionOrchestrator(tmp_path)
+        execution_order = [AgentType.PM, AgentType.ARCHITECT, AgentType.TL_UI_WEB]
+        phases = orch._compute_phases(execution_order)
 
-            # PM should be in phase 1 (no deps)
-            # ARCHITECT in phase 2 (depends on PM)
-            # TL_UI_WEB in phase 3 (depends on ARCHITECT)
-            assert len(phases) >= 2
-            assert "PM" in phases[0]["agents"]
+        # PM should be in phase 1 (no deps)
+        # ARCHITECT in phase 2 (depends on PM)
+        # TL_UI_WEB in phase 3 (depends on ARCHITECT)
+        assert len(phases) >= 2
+        assert "PM" in phases[0]["agents"]
 
     def test_generate_session_id(self):
-        """Test session ID generation."""
-        from agentic_builder.orchestration.single_session import SingleSessionOrchestrator
+        """Test session ID format, and that distinct random bytes give distinct IDs."""
+        orch = SingleSessionOrchestrator(Path("project"))
+        assert re.fullmatch(r"sess_[0-9a-f]{12}", orch._generate_session_id())
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            orch = SingleSessionOrchestrator(Path(tmpdir))
-            id1 = orch._generate_session_id()
-            id2 = orch._generate_session_id()
+        counter = itertools.count()
 
-            assert id1.startswith("sess_")
-            assert id2.startswith("sess_")
-            assert id1 != id2  # Should be unique
+        def rng(n):
+            return next(counter).to_bytes(n, "big")
+
+        assert orch._generate_session_id(rng) == "sess_000000000000"
+        assert orch._generate_session_id(rng) == "sess_000000000001"
+
+    def test_invoke_orchestrator_pipes_prompt_via_stdin(self, tmp_path):
+        """Test the orchestrator prompt is sent on stdin, not argv."""
+        orch = SingleSessionOrchestrator(tmp_path)
+        manifest = {"workflow": "FULL_APP_GENERATION", "session_id": "sess_x", "agents": [], "phases": []}
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value.returncode = 0
+            mock_run.return_value.stdout = b"done"
+            result = orch._invoke_orchestrator(manifest)
+
+        args, kwargs = mock_run.call_args
+        assert args[0][-1] == "-"
+        assert "-p" not in args[0]
+        assert b"sess_x" in kwargs["input"]
+        assert result["success"]
+        assert result["output"] == "done"
 
 
 class TestWorkflowConstraints:
@@ -300,8 +434,6 @@ class TestWorkflowConstraints:
 
     def test_default_constraints(self):
         """Test default constraint values."""
-        from agentic_builder.common.types import ScopeLevel, WorkflowConstraints
-
         constraints = WorkflowConstraints()
         assert constraints.scope == ScopeLevel.MVP
         assert constraints.full_feature is False
@@ -311,8 +443,6 @@ class TestWorkflowConstraints:
 
     def test_full_feature_effective_scope(self):
         """Test that full_feature overrides scope to comprehensive."""
-        from agentic_builder.common.types import ScopeLevel, WorkflowConstraints
-
         # With full_feature=True, effective scope should be COMPREHENSIVE
         constraints = WorkflowConstraints(full_feature=True, scope=ScopeLevel.MVP)
         assert constraints.effective_scope() == ScopeLevel.COMPREHENSIVE
@@ -321,26 +451,65 @@ class TestWorkflowConstraints:
         constraints = WorkflowConstraints(full_feature=False, scope=ScopeLevel.STANDARD)
         assert constraints.effective_scope() == ScopeLevel.STANDARD
 
-    def test_constraints_to_manifest_dict(self):
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            pytest.param(
+                {},
+                {
+                    "scope": "mvp",
+                    "full_feature": False,
+                    "interactive": True,
+                    "explicit_includes": [],
+                    "explicit_excludes": [],
+                },
+                id="default",
+            ),
+            pytest.param(
+                {"full_feature": True},
+                {
+                    "scope": "comprehensive",
+                    "full_feature": True,
+                    "interactive": True,
+                    "explicit_includes": [],
+                    "explicit_excludes": [],
+                },
+                id="full_feature",
+            ),
+            pytest.param(
+                {"scope": ScopeLevel.STANDARD},
+                {
+                    "scope": "standard",
+                    "full_feature": False,
+                    "interactive": True,
+                    "explicit_includes": [],
+                    "explicit_excludes": [],
+                },
+                id="standard_scope",
+            ),
+            pytest.param(
+                # full_feature=True should override scope to comprehensive
+                {
+                    "scope": ScopeLevel.STANDARD,
+                    "full_feature": True,
+                    "interactive": False,
+                    "explicit_includes": ["auth"],
+                    "explicit_excludes": ["mobile"],
+                },
+                {
+                    "scope": "comprehensive",
+                    "full_feature": True,
+                    "interactive": False,
+                    "explicit_includes": ["auth"],
+                    "explicit_excludes": ["mobile"],
+                },
+                id="includes_excludes",
+            ),
+        ],
+    )
+    def test_constraints_to_manifest_dict(self, kwargs, expected):
         """Test conversion to manifest dictionary."""
-        from agentic_builder.common.types import ScopeLevel, WorkflowConstraints
-
-        constraints = WorkflowConstraints(
-            scope=ScopeLevel.STANDARD,
-            full_feature=True,
-            interactive=False,
-            explicit_includes=["auth"],
-            explicit_excludes=["mobile"],
-        )
-
-        manifest_dict = constraints.to_manifest_dict()
-
-        # full_feature=True should override scope to comprehensive
-        assert manifest_dict["scope"] == "comprehensive"
-        assert manifest_dict["full_feature"] is True
-        assert manifest_dict["interactive"] is False
-        assert "auth" in manifest_dict["explicit_includes"]
-        assert "mobile" in manifest_dict["explicit_excludes"]
+        assert WorkflowConstraints(**kwargs).to_manifest_dict() == expected
 
 
 class TestOrchestratorTypes:
@@ -348,8 +517,6 @@ class TestOrchestratorTypes:
 
     def test_orchestrator_type_values(self):
         """Test OrchestratorType enum values."""
-        from agentic_builder.common.types import OrchestratorType
-
         assert OrchestratorType.ADAPTIVE.value == "adaptive"
         assert OrchestratorType.PARALLEL.value == "parallel"
         assert OrchestratorType.SEQUENTIAL.value == "sequential"
@@ -358,90 +525,71 @@ class TestOrchestratorTypes:
 class TestAdaptiveOrchestratorConstraints:
     """Tests for AdaptiveOrchestrator with constraints."""
 
-    def test_orchestrator_with_constraints(self):
+    def test_orchestrator_with_constraints(self, orch_root):
         """Test orchestrator accepts constraints."""
-        from agentic_builder.common.types import ScopeLevel, WorkflowConstraints
-        from agentic_builder.orchestration.adaptive_orchestrator import AdaptiveOrchestrator
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            constraints = WorkflowConstraints(
-                scope=ScopeLevel.COMPREHENSIVE,
-                full_feature=True,
-                interactive=False,
-            )
-            orch = AdaptiveOrchestrator(Path(tmpdir), constraints=constraints)
+        constraints = WorkflowConstraints(
+            scope=ScopeLevel.COMPREHENSIVE,
+            full_feature=True,
+            interactive=False,
+        )
+        orch = AdaptiveOrchestrator(orch_root, constraints=constraints)
 
-            assert orch.constraints.full_feature is True
-            assert orch.constraints.scope == ScopeLevel.COMPREHENSIVE
-            assert orch.interactive is False
+        assert orch.constraints.full_feature is True
+        assert orch.constraints.scope == ScopeLevel.COMPREHENSIVE
+        assert orch.interactive is False
 
-    def test_orchestrator_constraints_in_manifest(self):
-        """Test constraints are written to manifest."""
-        import json
+    def test_orchestrator_constraints_in_manifest(self, orch_root):
+        """Test constraints are included in the session manifest."""
+        constraints = WorkflowConstraints(
+            scope=ScopeLevel.COMPREHENSIVE,
+            full_feature=True,
+        )
+        orch = AdaptiveOrchestrator(orch_root, constraints=constraints)
 
-        from agentic_builder.common.types import ScopeLevel, WorkflowConstraints
-        from agentic_builder.orchestration.adaptive_orchestrator import AdaptiveOrchestrator
+        manifest = orch._build_manifest("test_session", "Build a todo app")
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            constraints = WorkflowConstraints(
-                scope=ScopeLevel.COMPREHENSIVE,
-                full_feature=True,
-            )
-            orch = AdaptiveOrchestrator(Path(tmpdir), constraints=constraints)
+        assert manifest["constraints"] == constraints.to_manifest_dict()
+        assert manifest["constraints"]["full_feature"] is True
+        assert manifest["constraints"]["scope"] == "comprehensive"
 
-            # Initialize session to create manifest
-            orch._initialize_session("test_session", "Build a todo app")
+    def test_initialize_session_writes_manifest(self, tmp_path):
+        """Test the manifest lands on disk in its JSON form."""
+        constraints = WorkflowConstraints(full_feature=True)
+        orch = AdaptiveOrchestrator(tmp_path, constraints=constraints)
 
-            # Read manifest and check constraints
-            manifest_path = Path(tmpdir) / ".tasks" / "manifest.json"
-            manifest = json.loads(manifest_path.read_text())
+        orch._initialize_session("test_session", "Build a todo app")
 
-            assert "constraints" in manifest
-            assert manifest["constraints"]["full_feature"] is True
-            assert manifest["constraints"]["scope"] == "comprehensive"
+        manifest = json.loads((tmp_path / ".tasks" / "manifest.json").read_text())
+        assert manifest["session_id"] == "test_session"
+        assert manifest["constraints"] == constraints.to_manifest_dict()
 
 
 class TestCLIIntegration:
     """Tests for CLI integration with new flags."""
 
-    def test_get_orchestrator_adaptive(self):
+    def test_get_orchestrator_adaptive(self, tmp_path):
         """Test get_orchestrator returns AdaptiveOrchestrator."""
-        from agentic_builder.common.types import OrchestratorType, WorkflowConstraints
-        from agentic_builder.main import get_orchestrator
-        from agentic_builder.orchestration.adaptive_orchestrator import AdaptiveOrchestrator
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            constraints = WorkflowConstraints(full_feature=True)
-            orch = get_orchestrator(
-                output_dir=Path(tmpdir),
-                orchestrator_type=OrchestratorType.ADAPTIVE,
-                constraints=constraints,
-            )
-            assert isinstance(orch, AdaptiveOrchestrator)
-            assert orch.constraints.full_feature is True
+        constraints = WorkflowConstraints(full_feature=True)
+        orch = get_orchestrator(
+            output_dir=tmp_path,
+            orchestrator_type=OrchestratorType.ADAPTIVE,
+            constraints=constraints,
+        )
+        assert isinstance(orch, AdaptiveOrchestrator)
+        assert orch.constraints.full_feature is True
 
-    def test_get_orchestrator_sequential(self):
+    def test_get_orchestrator_sequential(self, tmp_path):
         """Test get_orchestrator returns WorkflowEngine for sequential."""
-        from agentic_builder.common.types import OrchestratorType
-        from agentic_builder.main import get_orchestrator
-        from agentic_builder.orchestration.workflow_engine import WorkflowEngine
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            orch = get_orchestrator(
-                output_dir=Path(tmpdir),
-                orchestrator_type=OrchestratorType.SEQUENTIAL,
-            )
-            assert isinstance(orch, WorkflowEngine)
+        orch = get_orchestrator(
+            output_dir=tmp_path,
+            orchestrator_type=OrchestratorType.SEQUENTIAL,
+        )
+        assert isinstance(orch, WorkflowEngine)
 
-    def test_get_orchestrator_parallel(self):
+    def test_get_orchestrator_parallel(self, tmp_path):
         """Test get_orchestrator returns ParallelWorkflowEngine."""
-        from agentic_builder.common.types import OrchestratorType
-        from agentic_builder.main import get_orchestrator
-        from agentic_builder.orchestration.parallel_engine import ParallelWorkflowEngine
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            orch = get_orchestrator(
-                output_dir=Path(tmpdir),
-                orchestrator_type=OrchestratorType.PARALLEL,
-            )
-            assert isinstance(orch, ParallelWorkflowEngine)
+        orch = get_orchestrator(
+            output_dir=tmp_path,
+            orchestrator_type=OrchestratorType.PARALLEL,
+        )
+        assert isinstance(orch, ParallelWorkflowEngine)
@@ -1,16 +1,25 @@
-from unittest.mock import patch
+import logging
 
 import pytest
 
 from agentic_builder.common.types import AgentType, Task
+from agentic_builder.pms._xml_escape import escape_xml
 from agentic_builder.pms.context_serializer import ContextSerializer
-from agentic_builder.pms.task_manager import TaskManager
+from agentic_builder.pms.task_manager import TaskManager, TaskSpec
+
+
+@pytest.fixture(scope="module")
+def shared_task_manager(tmp_path_factory):
+    manager = TaskManager(output_dir=tmp_path_factory.mktemp("pms"))
+    yield manager
+    manager.close()
 
 
 @pytest.fixture
-def task_manager(tmp_path):
-    with patch("agentic_builder.pms.task_manager.get_project_root", return_value=tmp_path):
-        yield TaskManager()
+def task_manager(shared_task_manager):
+    """The module's TaskManager, emptied before each test."""
+    shared_task_manager.clear()
+    return shared_task_manager
 
 
 def test_create_task(task_manager):
@@ -41,6 +50,8 @@ def test_context_serializer():
     assert "<task_context>" in xml
     assert "<task_id>TASK-001</task_id>" in xml
     assert "Do something" in xml
+    # The leaf fast path renders the same document as the generator
+    assert xml == "".join(ContextSerializer.iter_serialize(task))
 
 
 def test_context_serializer_with_dependencies():
@@ -74,3 +85,157 @@ def test_context_serializer_with_dependencies():
     assert "Review architecture" in xml
     assert "Consider security implications" in xml
     assert "/path/to/file.py" in xml
+
+
+def test_context_serializer_escapes_dependency_output():
+    dep_task = Task(
+        id="TASK-001",
+        description="PM task",
+        agent_type=AgentType.PM,
+        output_summary="Use <div> & 'quotes'",
+    )
+    task = Task(id="TASK-002", description="Architect task", agent_type=AgentType.ARCHITECT)
+
+    xml = ContextSerializer.serialize(task, dependency_tasks={"TASK-001": dep_task})
+
+    assert "<summary>Use &lt;div&gt; &amp; &apos;quotes&apos;</summary>" in xml
+
+
+def test_context_serializer_full_layout():
+    dep_task = Task(
+        id="TASK-001",
+        description="PM task",
+        agent_type=AgentType.PM,
+        context_files=["docs/req.md"],
+        output_summary="Planned",
+        output_next_steps=["Design"],
+        output_warnings=["Scope"],
+    )
+    task = Task(
+        id="TASK-002",
+        description="Architect task",
+        agent_type=AgentType.ARCHITECT,
+        dependencies=["TASK-001"],
+        context_files=["src/app.py"],
+    )
+
+    xml = ContextSerializer.serialize(task, dependency_tasks={"TASK-001": dep_task}, project_idea="Todo app")
+
+    assert xml == (
+        "<task_context>\n"
+        "  <project_idea>\n"
+        "    Todo app\n"
+        "  </project_idea>\n"
+        "  <task_id>TASK-002</task_id>\n"
+        "  <agent_role>ARCHITECT</agent_role>\n"
+        "  <description>Architect task</description>\n"
+        "  <dependencies>\n"
+        "    <dependency id='TASK-001' agent='PM'>\n"
+        "      <summary>Planned</summary>\n"
+        "      <artifacts>\n"
+        "        <artifact path='docs/req.md'/>\n"
+        "      </artifacts>\n"
+        "      <next_steps>\n"
+        "        <step>Design</step>\n"
+        "      </next_steps>\n"
+        "      <warnings>\n"
+        "        <warning>Scope</warning>\n"
+        "      </warnings>\n"
+        "    </dependency>\n"
+        "  </dependencies>\n"
+        "  <files>\n"
+        "    <file path='src/app.py'/>\n"
+        "  </files>\n"
+        "</task_context>"
+    )
+    chunks = list(ContextSerializer.iter_serialize(task, {"TASK-001": dep_task}, "Todo app"))
+    assert all(chunk.endswith("\n") for chunk in chunks[:-1])
+    assert "".join(chunks) == xml
+
+
+def test_batch_create(task_manager):
+    root, child = task_manager.create_tasks(
+        [TaskSpec("Root", AgentType.PM), TaskSpec("Child", AgentType.ARCHITECT, ["TASK-0001"])]
+    )
+
+    assert (root.id, child.id) == ("TASK-0001", "TASK-0002")
+    assert task_manager.get_dependencies(child.id) == [root]
+    assert task_manager.create_task("Next", AgentType.TEST).id == "TASK-0003"
+
+    # Round-trips through the database, not just the cache
+    fresh = TaskManager(output_dir=task_manager.output_dir)
+    assert fresh.get_task(child.id) == child
+    assert fresh.get_dependencies(child.id) == [root]
+
+
+def test_clear_removes_tasks_and_restarts_ids(task_manager):
+    task = task_manager.create_task("Temp", AgentType.PM)
+    task_manager.clear()
+
+    assert task_manager.get_task(task.id) is None
+    assert task_manager.create_task("Fresh", AgentType.PM).id == "TASK-0001"
+
+
+def test_context_serializer_debug_logging(caplog):
+    dep_task = Task(id="TASK-001", description="PM task", agent_type=AgentType.PM, output_summary="Planned")
+    task = Task(id="TASK-002", description="Architect task", agent_type=AgentType.ARCHITECT)
+    expected = ContextSerializer.serialize(task, dependency_tasks={"TASK-001": dep_task})
+
+    with caplog.at_level(logging.DEBUG, logger="agentic_builder.pms.context_serializer"):
+        xml = ContextSerializer.serialize(task, dependency_tasks={"TASK-001": dep_task})
+
+    assert xml == expected
+    assert "Agent Type: ARCHITECT" in caplog.text
+    assert "Adding dependency: TASK-001 (agent: PM)" in caplog.text
+
+
+def test_task_ids_continue_after_existing_tasks(tmp_path):
+    first = TaskManager(output_dir=tmp_path)
+    first.create_task("One", AgentType.PM)
+    first.create_task("Two", AgentType.ARCHITECT)
+
+    # A fresh manager (e.g. on resume) continues after the highest existing id
+    second = TaskManager(output_dir=tmp_path)
+    task = second.create_task("Three", AgentType.TEST)
+
+    assert task.id == "TASK-0003"
+
+
+def test_get_task_reads_from_disk(tmp_path):
+    task = TaskManager(output_dir=tmp_path).create_task("Persisted", AgentType.PM, dependencies=["TASK-0000"])
+
+    # A fresh manager has an empty cache and must load the task from the database
+    loaded = TaskManager(output_dir=tmp_path).get_task(task.id)
+
+    assert loaded == task
+
+
+def test_get_dependencies_loads_from_disk_in_order(tmp_path):
+    writer = TaskManager(output_dir=tmp_path)
+    a = writer.create_task("A", AgentType.PM)
+    b = writer.create_task("B", AgentType.ARCHITECT)
+    child = writer.create_task("C", AgentType.TEST, dependencies=[b.id, "TASK-9999", a.id])
+
+    # A fresh manager pulls both dependencies through one query; unknown ids are skipped
+    reader = TaskManager(output_dir=tmp_path)
+    assert reader.get_dependencies(child.id) == [b, a]
+
+
+def test_legacy_task_files_imported(tmp_path):
+    task_dir = tmp_path / ".tasks"
+    task_dir.mkdir()
+    legacy = Task(id="TASK-0007", description="Old", agent_type=AgentType.PM)
+    (task_dir / "TASK-0007.json").write_text(legacy.model_dump_json(indent=2))
+
+    manager = TaskManager(output_dir=tmp_path)
+
+    assert manager.get_task("TASK-0007") == legacy
+    assert manager.create_task("New", AgentType.ARCHITECT).id == "TASK-0008"
+
+
+@pytest.mark.parametrize("repeat", [1, 200])  # Short (cached) and long (uncached) inputs
+def test_escape_xml(repeat):
+    text = "a & b <c> \"d\" 'e'" * repeat
+
+    assert escape_xml(text) == "a &amp; b &lt;c&gt; &quot;d&quot; &apos;e&apos;" * repeat
+    assert escape_xml("plain/path.py") == "plain/path.py"
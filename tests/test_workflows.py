@@ -1,4 +1,8 @@
-from agentic_builder.common.types import AgentType
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from agentic_builder.common.types import ALL_AGENT_TYPES, AgentType
 from agentic_builder.orchestration.workflows import WorkflowMapper, WorkflowType
 
 
@@ -13,7 +17,7 @@ def test_workflow_mapper_full_app():
     assert order.index(AgentType.DEV_FRONTEND) > order.index(AgentType.TL_FRONTEND)
 
     # Verify all agents are present (41 total agent types)
-    assert len(order) == len(list(AgentType))
+    assert len(order) == len(ALL_AGENT_TYPES)
 
 
 def test_workflow_mapper_code_review():
@@ -29,3 +33,69 @@ def test_workflow_mapper_feature_addition():
     assert AgentType.DEV_BACKEND in order
     # Verify sorting
     assert order.index(AgentType.DEV_BACKEND) > order.index(AgentType.TL_BACKEND)
+
+
+def test_topological_sort_orders_dependencies_after_input_order():
+    # DEV_BACKEND (a legacy alias of DEV_CORE_API) waits on TL_BACKEND even when listed first,
+    # then runs before PM because it is listed earlier
+    order = WorkflowMapper.topological_sort([AgentType.DEV_BACKEND, AgentType.TL_BACKEND, AgentType.PM])
+
+    assert order == [AgentType.TL_BACKEND, AgentType.DEV_BACKEND, AgentType.PM]
+
+
+def test_workflow_mapper_keeps_template_order():
+    # Review and test agents have no configured dependencies but still run after the code is written
+    assert WorkflowMapper.get_execution_order(WorkflowType.FEATURE_ADDITION) == (
+        AgentType.PM,
+        AgentType.ARCHITECT,
+        AgentType.UIUX_GUI,
+        AgentType.UIUX_CLI,
+        AgentType.TL_FRONTEND,
+        AgentType.TL_BACKEND,
+        AgentType.DEV_FRONTEND,
+        AgentType.DEV_BACKEND,
+        AgentType.TEST,
+        AgentType.CQR,
+        AgentType.SR,
+        AgentType.DOE,
+    )
+    assert WorkflowMapper.get_execution_order(WorkflowType.BUG_FIX) == (
+        AgentType.PM,
+        AgentType.TL_FRONTEND,
+        AgentType.TL_BACKEND,
+        AgentType.DEV_FRONTEND,
+        AgentType.DEV_BACKEND,
+        AgentType.TEST,
+    )
+
+
+def test_topological_sort_prefers_input_order_across_levels():
+    with patch("agentic_builder.orchestration.workflows.get_agent_config") as mock_config:
+        mock_config.side_effect = lambda agent: MagicMock(
+            dependencies=[AgentType.PM] if agent == AgentType.ARCHITECT else []
+        )
+        order = WorkflowMapper.topological_sort([AgentType.PM, AgentType.ARCHITECT, AgentType.TEST])
+
+    # TEST is ready before ARCHITECT but is listed after it
+    assert order == [AgentType.PM, AgentType.ARCHITECT, AgentType.TEST]
+
+
+def test_workflow_mapper_caches_execution_order():
+    order = WorkflowMapper.get_execution_order(WorkflowType.BUG_FIX)
+
+    assert isinstance(order, tuple)
+    # Enum members and their string values share one cache entry
+    assert WorkflowMapper.get_execution_order("BUG_FIX") is order
+    # Unknown names still fall back to the full workflow's cached order
+    assert WorkflowMapper.get_execution_order("create-app") is WorkflowMapper.get_execution_order(
+        WorkflowType.FULL_APP_GENERATION
+    )
+
+
+def test_topological_sort_rejects_cycles():
+    with patch("agentic_builder.orchestration.workflows.get_agent_config") as mock_config:
+        mock_config.side_effect = lambda agent: MagicMock(
+            dependencies=[AgentType.ARCHITECT] if agent == AgentType.PM else [AgentType.PM]
+        )
+        with pytest.raises(ValueError):
+            WorkflowMapper.topological_sort([AgentType.PM, AgentType.ARCHITECT])